@@ -1,14 +1,21 @@
 """Model provider abstractions for supporting multiple AI providers."""
 
-from .azure_openai import AzureOpenAIProvider
+from importlib import import_module
+
 from .base import ModelProvider
-from .gemini import GeminiModelProvider
-from .openai import OpenAIModelProvider
 from .openai_compatible import OpenAICompatibleProvider
-from .openrouter import OpenRouterProvider
 from .registry import ModelProviderRegistry
 from .shared import ModelCapabilities, ModelResponse
 
+# Concrete providers pull in their vendor SDKs (google-genai in particular is
+# slow to import), so they are only loaded when first accessed.
+_LAZY_PROVIDERS = {
+    "AzureOpenAIProvider": ".azure_openai",
+    "GeminiModelProvider": ".gemini",
+    "OpenAIModelProvider": ".openai",
+    "OpenRouterProvider": ".openrouter",
+}
+
 __all__ = [
     "ModelProvider",
     "ModelResponse",
@@ -20,3 +27,13 @@ __all__ = [
     "OpenAICompatibleProvider",
     "OpenRouterProvider",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    provider_class = getattr(import_module(module_name, __name__), name)
+    globals()[name] = provider_class
+    return provider_class
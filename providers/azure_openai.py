@@ -13,7 +13,7 @@ except ImportError:  # pragma: no cover
 from utils.env import get_env, suppress_env_vars
 
 from .openai import OpenAIModelProvider
-from .openai_compatible import OpenAICompatibleProvider
+from .openai_compatible import OpenAICompatibleProvider, get_shared_http_client
 from .registries.azure import AzureModelRegistry
 from .shared import ModelCapabilities, ModelResponse, ProviderType, TemperatureConstraint
 
@@ -70,6 +70,13 @@ class AzureOpenAIProvider(OpenAICompatibleProvider):
             deployment.lower(): canonical for canonical, deployment in self._deployment_map.items()
         }
         self._canonical_lookup = {name.lower(): name for name in self._model_specs.keys()}
+        # Aliases first so canonical names win on collision, matching the base resolver's precedence
+        self._name_lookup = {
+            alias.lower(): canonical
+            for canonical, capability in self._capabilities.items()
+            for alias in capability.aliases
+        }
+        self._name_lookup.update(self._canonical_lookup)
         self._invalidate_capability_cache()
 
     # ------------------------------------------------------------------
@@ -97,6 +104,11 @@ class AzureOpenAIProvider(OpenAICompatibleProvider):
             return True
         return super().validate_model_name(model_name)
 
+    def _resolve_model_name(self, model_name: str) -> str:
+        # Capabilities are fixed at construction, so resolve via the precomputed table
+        # instead of rescanning names and aliases on every request.
+        return self._name_lookup.get(model_name.lower(), model_name)
+
     def _build_capabilities_map(self) -> dict[str, ModelCapabilities]:
         capabilities: dict[str, ModelCapabilities] = {}
 
@@ -111,11 +123,14 @@ class AzureOpenAIProvider(OpenAICompatibleProvider):
 
                 if template:
                     friendly = template.friendly_name.replace("OpenAI", "Azure OpenAI", 1)
+                    # Older Azure api-versions reject prompt_cache_key, so deployments only send it
+                    # when their own spec or overrides opt in.
                     cloned = replace(
                         template,
                         provider=ProviderType.AZURE,
                         friendly_name=friendly,
                         aliases=list(template.aliases),
+                        supports_prompt_caching=False,
                     )
                 else:
                     deployment_name = spec.get("deployment", "")
@@ -239,15 +254,14 @@ class AzureOpenAIProvider(OpenAICompatibleProvider):
                     "Azure OpenAI support requires the 'openai' package. Install it with `pip install openai`."
                 )
 
-            import httpx
-
             proxy_env_vars = ["HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy"]
 
             with suppress_env_vars(*proxy_env_vars):
                 try:
                     timeout_config = self.timeout_config
 
-                    http_client = httpx.Client(timeout=timeout_config, follow_redirects=True)
+                    # Share the pooled (and, with h2 installed, HTTP/2) client used by other OpenAI-compatible providers
+                    http_client = get_shared_http_client(timeout_config, self.pool_limits, self.use_http2)
 
                     client_kwargs = {
                         "api_key": self.api_key,
@@ -319,12 +333,12 @@ class AzureOpenAIProvider(OpenAICompatibleProvider):
         resolved_canonical = self._resolve_model_name(model_name)
 
         if resolved_canonical not in self._deployment_map:
-            # The base resolver may hand back the deployment alias. Try to map it
-            # back to a canonical entry.
-            for canonical, deployment in self._deployment_map.items():
-                if deployment.lower() == resolved_canonical.lower():
-                    return canonical, deployment
-            raise ValueError(f"Model '{model_name}' is not configured for Azure OpenAI")
+            # The resolver hands back deployment names unchanged. Map them back to a
+            # canonical entry.
+            canonical = self._deployment_alias_lookup.get(resolved_canonical.lower())
+            if canonical is None:
+                raise ValueError(f"Model '{model_name}' is not configured for Azure OpenAI")
+            return canonical, self._deployment_map[canonical]
 
         return resolved_canonical, self._deployment_map[resolved_canonical]
 
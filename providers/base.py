@@ -1,6 +1,7 @@
 """Base interfaces and common behaviour for model providers."""
 
 import logging
+import random
 import time
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Callable, Optional
@@ -39,6 +40,13 @@ class ModelProvider(ABC):
     # All concrete providers must define their supported models
     MODEL_CAPABILITIES: dict[str, Any] = {}
 
+    # Fraction of each retry delay that is randomised so concurrent clients
+    # do not retry in lockstep (0 disables jitter)
+    RETRY_JITTER = 0.5
+
+    # Upper bound (seconds) applied to server-supplied Retry-After hints
+    MAX_RETRY_AFTER = 60.0
+
     def __init__(self, api_key: str, **kwargs):
         """Initialize the provider with API key and optional configuration."""
         self.api_key = api_key
@@ -239,6 +247,33 @@ class ModelProvider(ABC):
 
         return any(indicator in error_str for indicator in retryable_indicators)
 
+    def _get_retry_after(self, error: Exception) -> Optional[float]:
+        """Return the server-requested delay in seconds, if the error carries one.
+
+        Looks for a ``Retry-After`` header on ``error.response`` (as exposed by
+        the httpx-based SDKs). Only the delta-seconds form is honoured; HTTP
+        dates and malformed values are ignored.
+        """
+
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is None:
+            return None
+
+        try:
+            value = headers.get("retry-after")
+        except Exception:  # pragma: no cover - defensive against exotic header objects
+            return None
+
+        try:
+            retry_after = float(value)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_after < 0:
+            return None
+        return min(retry_after, self.MAX_RETRY_AFTER)
+
     def _run_with_retries(
         self,
         operation: Callable[[], Any],
@@ -252,7 +287,9 @@ class ModelProvider(ABC):
         Args:
             operation: Callable returning the provider result.
             max_attempts: Maximum number of attempts (>=1).
-            delays: Optional list of sleep durations between attempts.
+            delays: Optional list of maximum sleep durations between attempts;
+                each is reduced by up to ``RETRY_JITTER`` of its value. A
+                ``Retry-After`` hint on the error takes precedence.
             log_prefix: Optional identifier for log clarity.
 
         Returns:
@@ -281,12 +318,20 @@ class ModelProvider(ABC):
                 if not retryable or attempt_number >= attempts:
                     raise
 
-                delay_idx = min(attempt_index, len(delays) - 1) if delays else -1
-                delay = delays[delay_idx] if delay_idx >= 0 else 0.0
+                retry_after = self._get_retry_after(exc)
+                if retry_after is not None:
+                    # The server told us when to come back; follow it instead of the schedule
+                    delay = retry_after
+                else:
+                    delay_idx = min(attempt_index, len(delays) - 1) if delays else -1
+                    delay = delays[delay_idx] if delay_idx >= 0 else 0.0
+                    if delay > 0 and self.RETRY_JITTER > 0:
+                        # Jitter downwards only so the configured schedule stays the upper bound
+                        delay = random.uniform(delay * (1 - self.RETRY_JITTER), delay)
 
                 if delay > 0:
                     logger.warning(
-                        "%s retryable error (attempt %s/%s): %s. Retrying in %ss...",
+                        "%s retryable error (attempt %s/%s): %s. Retrying in %.1fs...",
                         log_prefix or self.__class__.__name__,
                         attempt_number,
                         attempts,
@@ -332,6 +377,15 @@ class ModelProvider(ABC):
         """
 
         capabilities = self.get_capabilities(model_name)
+        self._validate_temperature(capabilities, model_name, temperature)
+
+    def _validate_temperature(self, capabilities: ModelCapabilities, model_name: str, temperature: float) -> None:
+        """Raise ``ValueError`` if ``temperature`` violates the model's constraint.
+
+        Providers that already hold the resolved capabilities can call this
+        directly instead of :meth:`validate_parameters` to avoid a second
+        capability lookup.
+        """
 
         if not capabilities.temperature_constraint.validate(temperature):
             constraint_desc = capabilities.temperature_constraint.get_description()
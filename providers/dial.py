@@ -32,6 +32,9 @@ class DIALModelProvider(RegistryBackedProviderMixin, OpenAICompatibleProvider):
     MAX_RETRIES = 4
     RETRY_DELAYS = [1, 3, 5, 8]  # seconds
 
+    # Shared httpx.Client for deployment requests, created in __init__
+    _http_client = None
+
     def __init__(self, api_key: str, **kwargs):
         """Initialize DIAL provider with API key and host.
 
@@ -127,10 +130,9 @@ class DIALModelProvider(RegistryBackedProviderMixin, OpenAICompatibleProvider):
             if deployment not in self._deployment_clients:
                 from openai import OpenAI
 
-                # Build deployment-specific URL
-                base_url = str(self.client.base_url)
-                if base_url.endswith("/"):
-                    base_url = base_url[:-1]
+                # Build deployment-specific URL from the configured host; going through
+                # self.client here would construct an unused superclass OpenAI client
+                base_url = self.base_url.rstrip("/")
 
                 # Remove /openai suffix if present to reconstruct properly
                 if base_url.endswith("/openai"):
@@ -286,18 +288,12 @@ class DIALModelProvider(RegistryBackedProviderMixin, OpenAICompatibleProvider):
         self._deployment_clients.clear()
 
         # Close the shared HTTP client
-        if hasattr(self, "_http_client"):
+        if self._http_client is not None:
             try:
                 self._http_client.close()
                 logger.debug("Closed shared HTTP client")
             except Exception as e:
                 logger.warning(f"Error closing shared HTTP client: {e}")
 
-        # Also close the client created by the superclass (OpenAICompatibleProvider)
-        # as it holds its own httpx.Client instance that is not used by DIAL's generate_content
-        if hasattr(self, "client") and self.client and hasattr(self.client, "close"):
-            try:
-                self.client.close()
-                logger.debug("Closed superclass's OpenAI client")
-            except Exception as e:
-                logger.warning(f"Error closing superclass's OpenAI client: {e}")
+        # The superclass client, if one was ever built, sits on the process-wide pool shared with
+        # other providers; closing it would close that pool for everyone, so it is left alone.
@@ -1,7 +1,7 @@
 """Gemini model provider implementation."""
 
-import base64
 import logging
+import re
 from typing import TYPE_CHECKING, ClassVar, Optional
 
 if TYPE_CHECKING:
@@ -16,7 +16,7 @@ from utils.image_utils import validate_image
 from .base import ModelProvider
 from .registries.gemini import GeminiModelRegistry
 from .registry_provider_mixin import RegistryBackedProviderMixin
-from .shared import ModelCapabilities, ModelResponse, ProviderType
+from .shared import ModelCapabilities, ModelResponse, ProviderType, ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -42,12 +42,24 @@ class GeminiModelProvider(RegistryBackedProviderMixin, ModelProvider):
         "max": 1.0,  # 100% of max - full thinking budget
     }
 
+    # Error classification patterns used by _is_error_retryable (compiled once)
+    _RATE_LIMIT_PATTERN = re.compile(r"\b429\b|quota|resource_exhausted", re.IGNORECASE)
+    _NON_RETRYABLE_PATTERN = re.compile(
+        r"quota[ _]exceeded|resource[ _]exhausted|context length|token limit|request too large|invalid request",
+        re.IGNORECASE,
+    )
+    _RETRYABLE_PATTERN = re.compile(
+        r"timeout|connection|network|temporary|unavailable|retry|internal error|ssl|handshake"
+        r"|\b(?:408|500|502|503|504)\b",
+        re.IGNORECASE,
+    )
+
     def __init__(self, api_key: str, **kwargs):
         """Initialize Gemini provider with API key and optional base URL."""
         self._ensure_registry()
         super().__init__(api_key, **kwargs)
         self._client = None
-        self._token_counters = {}  # Cache for token counting
+        self._response_cache = ResponseCache.from_env()  # Exact-match cache for deterministic requests
         self._base_url = kwargs.get("base_url", None)  # Optional custom endpoint
         self._timeout_override = self._resolve_http_timeout()
         self._invalidate_capability_cache()
@@ -133,17 +145,18 @@ class GeminiModelProvider(RegistryBackedProviderMixin, ModelProvider):
             max_output_tokens: Optional maximum number of tokens to generate in the response
             thinking_mode: Thinking budget level for models that support it ("minimal", "low", "medium", "high", "max"), default "medium"
             images: Optional list of image paths or data URLs to include with the prompt (for vision models)
-            **kwargs: Additional keyword arguments (reserved for future use)
+            **kwargs: Additional keyword arguments; ``no_cache=True`` bypasses the response cache
 
         Returns:
             ModelResponse: Contains the generated content, token usage stats, model metadata, and safety information
         """
-        # Validate parameters and fetch capabilities
-        self.validate_parameters(model_name, temperature)
+        no_cache = kwargs.pop("no_cache", False)
+
+        # Resolve capabilities once and validate parameters against them
         capabilities = self.get_capabilities(model_name)
-        capability_map = self.get_all_model_capabilities()
+        self._validate_temperature(capabilities, model_name, temperature)
 
-        resolved_model_name = self._resolve_model_name(model_name)
+        resolved_model_name = capabilities.model_name
 
         # Prepare content parts (text and potentially images)
         parts = []
@@ -164,11 +177,11 @@ class GeminiModelProvider(RegistryBackedProviderMixin, ModelProvider):
                     if image_part:
                         parts.append(image_part)
                 except Exception as e:
-                    logger.warning(f"Failed to process image {image_path}: {e}")
+                    logger.warning("Failed to process image %s: %s", image_path, e)
                     # Continue with other images and text
                     continue
         elif images and not capabilities.supports_images:
-            logger.warning(f"Model {resolved_model_name} does not support images, ignoring {len(images)} image(s)")
+            logger.warning("Model %s does not support images, ignoring %d image(s)", resolved_model_name, len(images))
 
         # Create contents structure
         contents = [{"parts": parts}]
@@ -195,12 +208,25 @@ class GeminiModelProvider(RegistryBackedProviderMixin, ModelProvider):
         # Add thinking configuration for models that support it
         if capabilities.supports_extended_thinking and effective_thinking_mode in self.THINKING_BUDGETS:
             # Get model's max thinking tokens and calculate actual budget
-            model_config = capability_map.get(resolved_model_name)
-            if model_config and model_config.max_thinking_tokens > 0:
-                max_thinking_tokens = model_config.max_thinking_tokens
+            if capabilities.max_thinking_tokens > 0:
+                max_thinking_tokens = capabilities.max_thinking_tokens
                 actual_thinking_budget = int(max_thinking_tokens * self.THINKING_BUDGETS[effective_thinking_mode])
                 generation_config.thinking_config = types.ThinkingConfig(thinking_budget=actual_thinking_budget)
 
+        # Deterministic text-only requests can be answered from the exact-match cache;
+        # the key covers the final request (model, contents and generation config)
+        cache_key = None
+        if generation_config.temperature == 0 and not images and not no_cache:
+            cache_key = ResponseCache.make_key(
+                resolved_model_name,
+                contents,
+                generation_config.model_dump(mode="json", exclude_none=True),
+            )
+            cached_response = self._response_cache.get(cache_key)
+            if cached_response is not None:
+                logger.debug("Serving %s response from exact-match cache", resolved_model_name)
+                return cached_response
+
         # Retry logic with progressive delays
         max_retries = 4  # Total of 4 attempts
         retry_delays = [1, 3, 5, 8]  # Progressive delays: 1s, 3s, 5s, 8s
@@ -215,6 +241,8 @@ class GeminiModelProvider(RegistryBackedProviderMixin, ModelProvider):
             )
 
             usage = self._extract_usage(response)
+            # response.text re-joins the first candidate's text parts on each access, so read it once
+            response_text = response.text
 
             finish_reason_str = "UNKNOWN"
             is_blocked_by_safety = False
@@ -235,7 +263,7 @@ class GeminiModelProvider(RegistryBackedProviderMixin, ModelProvider):
                 except AttributeError:
                     finish_reason_str = "STOP"
 
-                if not response.text:
+                if not response_text:
                     try:
                         safety_ratings = candidate.safety_ratings
                         if safety_ratings:
@@ -282,7 +310,7 @@ class GeminiModelProvider(RegistryBackedProviderMixin, ModelProvider):
                     pass
 
             return ModelResponse(
-                content=response.text,
+                content=response_text,
                 usage=usage,
                 model_name=resolved_model_name,
                 friendly_name="Gemini",
@@ -296,7 +324,7 @@ class GeminiModelProvider(RegistryBackedProviderMixin, ModelProvider):
             )
 
         try:
-            return self._run_with_retries(
+            model_response = self._run_with_retries(
                 operation=_attempt,
                 max_attempts=max_retries,
                 delays=retry_delays,
@@ -310,6 +338,11 @@ class GeminiModelProvider(RegistryBackedProviderMixin, ModelProvider):
             )
             raise RuntimeError(error_msg) from exc
 
+        if cache_key is not None and model_response.content and not model_response.metadata["is_blocked_by_safety"]:
+            self._response_cache.put(cache_key, model_response)
+
+        return model_response
+
     def get_provider_type(self) -> ProviderType:
         """Get the provider type."""
         return ProviderType.GOOGLE
@@ -318,37 +351,23 @@ class GeminiModelProvider(RegistryBackedProviderMixin, ModelProvider):
         """Extract token usage from Gemini response."""
         usage = {}
 
-        # Try to extract usage metadata from response
         # Note: The actual structure depends on the SDK version and response format
-        try:
-            metadata = response.usage_metadata
-            if metadata:
-                # Extract token counts with explicit None checks
-                input_tokens = None
-                output_tokens = None
+        metadata = getattr(response, "usage_metadata", None)
+        if not metadata:
+            return usage
 
-                try:
-                    value = metadata.prompt_token_count
-                    if value is not None:
-                        input_tokens = value
-                        usage["input_tokens"] = value
-                except (AttributeError, TypeError):
-                    pass
+        # Extract token counts with explicit None checks
+        input_tokens = getattr(metadata, "prompt_token_count", None)
+        output_tokens = getattr(metadata, "candidates_token_count", None)
 
-                try:
-                    value = metadata.candidates_token_count
-                    if value is not None:
-                        output_tokens = value
-                        usage["output_tokens"] = value
-                except (AttributeError, TypeError):
-                    pass
+        if input_tokens is not None:
+            usage["input_tokens"] = input_tokens
+        if output_tokens is not None:
+            usage["output_tokens"] = output_tokens
 
-                # Calculate total only if both values are available and valid
-                if input_tokens is not None and output_tokens is not None:
-                    usage["total_tokens"] = input_tokens + output_tokens
-        except (AttributeError, TypeError):
-            # response doesn't have usage_metadata
-            pass
+        # Calculate total only if both values are available and valid
+        if input_tokens is not None and output_tokens is not None:
+            usage["total_tokens"] = input_tokens + output_tokens
 
         return usage
 
@@ -363,22 +382,12 @@ class GeminiModelProvider(RegistryBackedProviderMixin, ModelProvider):
         Returns:
             True if error should be retried, False otherwise
         """
-        error_str = str(error).lower()
+        error_str = str(error)
 
         # Check for 429 errors first - these need special handling
-        if "429" in error_str or "quota" in error_str or "resource_exhausted" in error_str:
+        if self._RATE_LIMIT_PATTERN.search(error_str):
             # For Gemini, check for specific non-retryable error indicators
             # These typically indicate permanent failures or quota/size limits
-            non_retryable_indicators = [
-                "quota exceeded",
-                "resource exhausted",
-                "context length",
-                "token limit",
-                "request too large",
-                "invalid request",
-                "quota_exceeded",
-                "resource_exhausted",
-            ]
 
             # Also check if this is a structured error from Gemini SDK
             try:
@@ -393,64 +402,42 @@ class GeminiModelProvider(RegistryBackedProviderMixin, ModelProvider):
                         pass
 
                 if error_details:
-                    error_details_str = str(error_details).lower()
                     # Check for non-retryable error codes/reasons
-                    if any(indicator in error_details_str for indicator in non_retryable_indicators):
-                        logger.debug(f"Non-retryable Gemini error: {error_details}")
+                    if self._NON_RETRYABLE_PATTERN.search(str(error_details)):
+                        logger.debug("Non-retryable Gemini error: %s", error_details)
                         return False
             except Exception:
                 pass
 
             # Check main error string for non-retryable patterns
-            if any(indicator in error_str for indicator in non_retryable_indicators):
-                logger.debug(f"Non-retryable Gemini error based on message: {error_str[:200]}...")
+            if self._NON_RETRYABLE_PATTERN.search(error_str):
+                logger.debug("Non-retryable Gemini error based on message: %s...", error_str[:200])
                 return False
 
             # If it's a 429/quota error but doesn't match non-retryable patterns, it might be retryable rate limiting
-            logger.debug(f"Retryable Gemini rate limiting error: {error_str[:100]}...")
+            logger.debug("Retryable Gemini rate limiting error: %s...", error_str[:100])
             return True
 
         # For non-429 errors, check if they're retryable
-        retryable_indicators = [
-            "timeout",
-            "connection",
-            "network",
-            "temporary",
-            "unavailable",
-            "retry",
-            "internal error",
-            "408",  # Request timeout
-            "500",  # Internal server error
-            "502",  # Bad gateway
-            "503",  # Service unavailable
-            "504",  # Gateway timeout
-            "ssl",  # SSL errors
-            "handshake",  # Handshake failures
-        ]
-
-        return any(indicator in error_str for indicator in retryable_indicators)
-
-    def _process_image(self, image_path: str) -> Optional[dict]:
-        """Process an image for Gemini API."""
+        return self._RETRYABLE_PATTERN.search(error_str) is not None
+
+    def _process_image(self, image_path: str) -> Optional[types.Part]:
+        """Process an image for Gemini API.
+
+        The validated bytes are passed straight to the SDK as an inline-data
+        part, so file images are never base64-encoded here only to be decoded
+        again by the client.
+        """
         try:
-            # Use base class validation
+            # Use base class validation (data URLs are decoded once here)
             image_bytes, mime_type = validate_image(image_path)
-
-            # For data URLs, extract the base64 data directly
-            if image_path.startswith("data:"):
-                # Extract base64 data from data URL
-                _, data = image_path.split(",", 1)
-                return {"inline_data": {"mime_type": mime_type, "data": data}}
-            else:
-                # For file paths, encode the bytes
-                image_data = base64.b64encode(image_bytes).decode()
-                return {"inline_data": {"mime_type": mime_type, "data": image_data}}
+            return types.Part.from_bytes(data=image_bytes, mime_type=mime_type)
 
         except ValueError as e:
             logger.warning(str(e))
             return None
         except Exception as e:
-            logger.error(f"Error processing image {image_path}: {e}")
+            logger.error("Error processing image %s: %s", image_path, e)
             return None
 
     def get_preferred_model(self, category: "ToolModelCategory", allowed_models: list[str]) -> Optional[str]:
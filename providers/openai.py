@@ -6,6 +6,10 @@ from typing import TYPE_CHECKING, ClassVar, Optional
 if TYPE_CHECKING:
     from tools.models import ToolModelCategory
 
+    from .registries.openrouter import OpenRouterModelRegistry
+
+from utils.env import get_env
+
 from .openai_compatible import OpenAICompatibleProvider
 from .registries.openai import OpenAIModelRegistry
 from .registry_provider_mixin import RegistryBackedProviderMixin
@@ -25,6 +29,12 @@ class OpenAIModelProvider(RegistryBackedProviderMixin, OpenAICompatibleProvider)
     REGISTRY_CLASS = OpenAIModelRegistry
     MODEL_CAPABILITIES: ClassVar[dict[str, ModelCapabilities]] = {}
 
+    # Custom/OpenRouter catalogue consulted for OpenAI models missing from the
+    # built-in registry; loaded on first miss and shared across instances. The
+    # key records the registry class and config path it was built from.
+    _custom_registry: ClassVar[Optional["OpenRouterModelRegistry"]] = None
+    _custom_registry_key: ClassVar[Optional[tuple]] = None
+
     def __init__(self, api_key: str, **kwargs):
         """Initialize OpenAI provider with API key."""
         self._ensure_registry()
@@ -50,9 +60,7 @@ class OpenAIModelProvider(RegistryBackedProviderMixin, OpenAICompatibleProvider)
             return builtin
 
         try:
-            from .registries.openrouter import OpenRouterModelRegistry
-
-            registry = OpenRouterModelRegistry()
+            registry = self._get_custom_registry()
             config = registry.get_model_config(canonical_name)
 
             if config and config.provider == ProviderType.OPENAI:
@@ -63,6 +71,25 @@ class OpenAIModelProvider(RegistryBackedProviderMixin, OpenAICompatibleProvider)
 
         return None
 
+    @staticmethod
+    def _get_custom_registry() -> "OpenRouterModelRegistry":
+        """Return the shared custom model registry, loading it on first use."""
+
+        from .registries.openrouter import OpenRouterModelRegistry
+
+        key = (OpenRouterModelRegistry, get_env("OPENROUTER_MODELS_CONFIG_PATH"))
+        if OpenAIModelProvider._custom_registry is None or OpenAIModelProvider._custom_registry_key != key:
+            OpenAIModelProvider._custom_registry = OpenRouterModelRegistry()
+            OpenAIModelProvider._custom_registry_key = key
+        return OpenAIModelProvider._custom_registry
+
+    @classmethod
+    def reload_registry(cls) -> None:
+        """Force a registry reload, including the custom model catalogue (used in tests)."""
+
+        OpenAIModelProvider._custom_registry = None
+        super().reload_registry()
+
     def _finalise_capabilities(
         self,
         capabilities: ModelCapabilities,
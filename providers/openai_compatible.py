@@ -1,12 +1,26 @@
 """Base class for OpenAI-compatible API providers."""
 
+import ast
+import base64
 import copy
+import hashlib
+import importlib.util
 import ipaddress
+import json
 import logging
+import re
+import threading
+from functools import cache, lru_cache
 from typing import Optional
 from urllib.parse import urlparse
 
-from openai import OpenAI
+import httpx
+from openai import APIConnectionError, APIStatusError, InternalServerError, OpenAI
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
 
 from utils.env import get_env, suppress_env_vars
 from utils.image_utils import validate_image
@@ -16,8 +30,118 @@ from .shared import (
     ModelCapabilities,
     ModelResponse,
     ProviderType,
+    ResponseCache,
 )
 
+_LOCALHOST_NAMES = frozenset({"localhost", "127.0.0.1", "::1"})
+
+# Default (connect, read, write, pool) timeouts in seconds. Custom URLs and local
+# models get longer windows for network latency, extended thinking and slower inference.
+_TIMEOUT_PROFILES = {
+    "default": (30.0, 600.0, 600.0, 600.0),  # OpenAI-like read window, generous connect
+    "custom": (45.0, 900.0, 900.0, 900.0),  # custom remote endpoints
+    "local": (60.0, 1800.0, 1800.0, 1800.0),  # local models (extended thinking)
+}
+
+# Process-wide httpx clients shared by every provider with the same pool settings
+_SHARED_HTTP_CLIENTS: dict[tuple, object] = {}
+_SHARED_HTTP_CLIENTS_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=64)
+def _get_tiktoken_encoding(model_name: str):
+    """Return the tiktoken encoding for ``model_name``, defaulting to cl100k_base."""
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@cache
+def _http2_available() -> bool:
+    """Return True when the optional h2 package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@cache
+def _build_timeout(connect: float, read: float, write: float, pool: float) -> httpx.Timeout:
+    """Return a shared httpx.Timeout for the given settings."""
+    return httpx.Timeout(connect=connect, read=read, write=write, pool=pool)
+
+
+@cache
+def _build_limits(max_connections: int, max_keepalive_connections: int, keepalive_expiry: float) -> httpx.Limits:
+    """Return a shared httpx.Limits for the given pool settings."""
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def get_shared_http_client(timeout, limits, http2: bool = False):
+    """Return the process-wide httpx.Client for the given timeout and pool limits.
+
+    Providers pointing at different hosts can still share a client because
+    httpx keeps a separate connection pool per origin internally.
+    """
+    key = (
+        tuple(sorted(timeout.as_dict().items())),
+        limits.max_connections,
+        limits.max_keepalive_connections,
+        limits.keepalive_expiry,
+        http2,
+    )
+
+    with _SHARED_HTTP_CLIENTS_LOCK:
+        http_client = _SHARED_HTTP_CLIENTS.get(key)
+        if http_client is None or http_client.is_closed:
+            http_client = httpx.Client(
+                timeout=timeout,
+                limits=limits,
+                http2=http2,
+                follow_redirects=True,
+            )
+            _SHARED_HTTP_CLIENTS[key] = http_client
+        return http_client
+
+
+def close_shared_http_clients() -> None:
+    """Close every process-wide httpx client created for OpenAI-compatible providers."""
+    with _SHARED_HTTP_CLIENTS_LOCK:
+        clients = list(_SHARED_HTTP_CLIENTS.values())
+        _SHARED_HTTP_CLIENTS.clear()
+
+    for http_client in clients:
+        try:
+            http_client.close()
+        except Exception as e:
+            logging.debug("Error closing shared HTTP client: %s", e)
+
+
+def _prompt_cache_key(system_prompt: str) -> str:
+    """Return a stable prompt-cache routing key for requests sharing ``system_prompt``."""
+    return hashlib.blake2b(system_prompt.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=32)
+def _is_local_hostname(hostname: Optional[str]) -> bool:
+    """Return True when ``hostname`` is localhost or a private network address."""
+    if not hostname:
+        return False
+
+    # Check for common localhost patterns
+    if hostname in _LOCALHOST_NAMES:
+        return True
+
+    # Check for private network ranges (local network)
+    try:
+        ip = ipaddress.ip_address(hostname)
+    except ValueError:
+        # Not an IP address, might be a hostname
+        return False
+    return ip.is_private or ip.is_loopback
+
 
 class OpenAICompatibleProvider(ModelProvider):
     """Shared implementation for OpenAI API lookalikes.
@@ -31,6 +155,44 @@ class OpenAICompatibleProvider(ModelProvider):
     DEFAULT_HEADERS = {}
     FRIENDLY_NAME = "OpenAI Compatible"
 
+    # Sentinels for attributes that may be set after construction (tests inject a transport)
+    timeout_config: Optional[httpx.Timeout] = None
+    _test_transport: Optional[httpx.BaseTransport] = None
+
+    # Chat role -> (responses role, content type) for the /v1/responses endpoint.
+    # For o3-pro, system messages should be handled carefully to avoid policy violations,
+    # so system content is sent naturally as user input rather than prefixed with "System:".
+    _RESPONSES_ROLE_MAP = {
+        "system": ("user", "input_text"),
+        "user": ("user", "input_text"),
+        "assistant": ("assistant", "output_text"),
+    }
+
+    # Transport/SDK exception types that are always worth retrying
+    _RETRYABLE_ERROR_TYPES = (
+        httpx.TimeoutException,
+        httpx.ConnectError,
+        httpx.RemoteProtocolError,
+        APIConnectionError,  # includes APITimeoutError
+        InternalServerError,
+    )
+    _RETRYABLE_STATUS_CODES = frozenset({408, 500, 502, 503, 504})
+
+    # Error classification patterns used by _is_error_retryable (compiled once)
+    _RATE_LIMIT_PATTERN = re.compile(r"\b429\b")
+    _ERROR_PAYLOAD_PATTERN = re.compile(r"\{.*\}")
+    _RETRYABLE_PATTERN = re.compile(
+        r"timeout|connection|network|temporary|unavailable|retry|ssl|handshake|\b(?:408|500|502|503|504)\b",
+        re.IGNORECASE,
+    )
+
+    # Connection pool defaults; keep-alive outlasts nginx's default 75s idle window
+    HTTP_POOL_LIMITS = {
+        "max_connections": 1000,
+        "max_keepalive_connections": 100,
+        "keepalive_expiry": 75.0,
+    }
+
     def __init__(self, api_key: str, base_url: str = None, **kwargs):
         """Initialize the provider with API key and optional base URL.
 
@@ -42,12 +204,20 @@ class OpenAICompatibleProvider(ModelProvider):
         self._allowed_alias_cache: dict[str, str] = {}
         super().__init__(api_key, **kwargs)
         self._client = None
+        self._response_cache = ResponseCache.from_env()  # Exact-match cache for deterministic requests
         self.base_url = base_url
+        # Parse once; validation, HTTP/2 and localhost checks all read the parsed form
+        self._parsed_base_url = self._parse_base_url()
+        self._is_local = self._compute_is_local()
         self.organization = kwargs.get("organization")
+        # Provider type is fixed per class; resolve it once for the per-request paths
+        self._provider_type = self.get_provider_type()
         self.allowed_models = self._parse_allowed_models()
 
         # Configure timeouts - especially important for custom/local endpoints
         self.timeout_config = self._configure_timeouts(**kwargs)
+        self.pool_limits = self._configure_pool_limits()
+        self.use_http2 = self._should_use_http2()
 
         # Validate base URL for security
         if self.base_url:
@@ -56,8 +226,9 @@ class OpenAICompatibleProvider(ModelProvider):
         # Warn if using external URL without authentication
         if self.base_url and not self._is_localhost_url() and not api_key:
             logging.warning(
-                f"Using external URL '{self.base_url}' without API key. "
-                "This may be insecure. Consider setting an API key for authentication."
+                "Using external URL '%s' without API key. "
+                "This may be insecure. Consider setting an API key for authentication.",
+                self.base_url,
             )
 
     def _ensure_model_allowed(
@@ -110,7 +281,7 @@ class OpenAICompatibleProvider(ModelProvider):
             Set of allowed model names (lowercase) or None if not configured
         """
         # Get provider-specific allowed models
-        provider_type = self.get_provider_type().value.upper()
+        provider_type = self._provider_type.value.upper()
         env_var = f"{provider_type}_ALLOWED_MODELS"
         models_str = get_env(env_var, "") or ""
 
@@ -118,15 +289,17 @@ class OpenAICompatibleProvider(ModelProvider):
             # Parse and normalize to lowercase for case-insensitive comparison
             models = {m.strip().lower() for m in models_str.split(",") if m.strip()}
             if models:
-                logging.info(f"Configured allowed models for {self.FRIENDLY_NAME}: {sorted(models)}")
+                logging.info("Configured allowed models for %s: %s", self.FRIENDLY_NAME, sorted(models))
                 self._allowed_alias_cache = {}
                 return models
 
         # Log info if no allow-list configured for proxy providers
-        if self.get_provider_type() not in [ProviderType.GOOGLE, ProviderType.OPENAI]:
+        if self._provider_type not in (ProviderType.GOOGLE, ProviderType.OPENAI):
             logging.info(
-                f"Model allow-list not configured for {self.FRIENDLY_NAME} - all models permitted. "
-                f"To restrict access, set {env_var} with comma-separated model names."
+                "Model allow-list not configured for %s - all models permitted. "
+                "To restrict access, set %s with comma-separated model names.",
+                self.FRIENDLY_NAME,
+                env_var,
             )
 
         return None
@@ -142,88 +315,106 @@ class OpenAICompatibleProvider(ModelProvider):
         Returns:
             httpx.Timeout object with appropriate timeout settings
         """
-        import httpx
-
-        # Default timeouts - more generous for custom/local endpoints
-        default_connect = 30.0  # 30 seconds for connection (vs OpenAI's 5s)
-        default_read = 600.0  # 10 minutes for reading (same as OpenAI default)
-        default_write = 600.0  # 10 minutes for writing
-        default_pool = 600.0  # 10 minutes for pool
-
-        # For custom/local URLs, use even longer timeouts
         if self.base_url and self._is_localhost_url():
-            default_connect = 60.0  # 1 minute for local connections
-            default_read = 1800.0  # 30 minutes for local models (extended thinking)
-            default_write = 1800.0  # 30 minutes for local models
-            default_pool = 1800.0  # 30 minutes for local models
-            logging.info(f"Using extended timeouts for local endpoint: {self.base_url}")
+            profile = "local"
         elif self.base_url:
-            default_connect = 45.0  # 45 seconds for custom remote endpoints
-            default_read = 900.0  # 15 minutes for custom remote endpoints
-            default_write = 900.0  # 15 minutes for custom remote endpoints
-            default_pool = 900.0  # 15 minutes for custom remote endpoints
-            logging.info(f"Using extended timeouts for custom endpoint: {self.base_url}")
-
-        # Allow override via kwargs or environment variables in future, for now...
-        connect_timeout = kwargs.get("connect_timeout")
-        if connect_timeout is None:
-            connect_timeout_raw = get_env("CUSTOM_CONNECT_TIMEOUT")
-            connect_timeout = float(connect_timeout_raw) if connect_timeout_raw is not None else float(default_connect)
-
-        read_timeout = kwargs.get("read_timeout")
-        if read_timeout is None:
-            read_timeout_raw = get_env("CUSTOM_READ_TIMEOUT")
-            read_timeout = float(read_timeout_raw) if read_timeout_raw is not None else float(default_read)
-
-        write_timeout = kwargs.get("write_timeout")
-        if write_timeout is None:
-            write_timeout_raw = get_env("CUSTOM_WRITE_TIMEOUT")
-            write_timeout = float(write_timeout_raw) if write_timeout_raw is not None else float(default_write)
-
-        pool_timeout = kwargs.get("pool_timeout")
-        if pool_timeout is None:
-            pool_timeout_raw = get_env("CUSTOM_POOL_TIMEOUT")
-            pool_timeout = float(pool_timeout_raw) if pool_timeout_raw is not None else float(default_pool)
-
-        timeout = httpx.Timeout(connect=connect_timeout, read=read_timeout, write=write_timeout, pool=pool_timeout)
+            profile = "custom"
+        else:
+            profile = "default"
+
+        if profile != "default":
+            logging.info("Using extended timeouts for %s endpoint: %s", profile, self.base_url)
+
+        # Explicit kwargs win, then CUSTOM_*_TIMEOUT environment variables, then the profile default
+        resolved = []
+        for name, default in zip(("connect", "read", "write", "pool"), _TIMEOUT_PROFILES[profile]):
+            value = kwargs.get(f"{name}_timeout")
+            if value is None:
+                raw = get_env(f"CUSTOM_{name.upper()}_TIMEOUT")
+                value = float(raw) if raw is not None else default
+            resolved.append(value)
+        connect_timeout, read_timeout, write_timeout, pool_timeout = resolved
+
+        timeout = _build_timeout(connect_timeout, read_timeout, write_timeout, pool_timeout)
 
         logging.debug(
-            f"Configured timeouts - Connect: {connect_timeout}s, Read: {read_timeout}s, "
-            f"Write: {write_timeout}s, Pool: {pool_timeout}s"
+            "Configured timeouts - Connect: %ss, Read: %ss, Write: %ss, Pool: %ss",
+            connect_timeout,
+            read_timeout,
+            write_timeout,
+            pool_timeout,
         )
 
         return timeout
 
-    def _is_localhost_url(self) -> bool:
-        """Check if the base URL points to localhost or local network.
+    def _configure_pool_limits(self):
+        """Configure HTTP connection pool limits, allowing env overrides.
 
         Returns:
-            True if URL is localhost or local network, False otherwise
+            httpx.Limits object sized for concurrent model calls
         """
-        if not self.base_url:
-            return False
+        max_connections_raw = get_env("ZEN_HTTPX_MAX_CONNECTIONS")
+        max_keepalive_raw = get_env("ZEN_HTTPX_MAX_KEEPALIVE_CONNECTIONS")
+        keepalive_expiry_raw = get_env("ZEN_HTTPX_KEEPALIVE_EXPIRY")
 
-        try:
-            parsed = urlparse(self.base_url)
-            hostname = parsed.hostname
+        max_connections = (
+            int(max_connections_raw) if max_connections_raw is not None else self.HTTP_POOL_LIMITS["max_connections"]
+        )
+        max_keepalive = (
+            int(max_keepalive_raw)
+            if max_keepalive_raw is not None
+            else self.HTTP_POOL_LIMITS["max_keepalive_connections"]
+        )
+        keepalive_expiry = (
+            float(keepalive_expiry_raw)
+            if keepalive_expiry_raw is not None
+            else self.HTTP_POOL_LIMITS["keepalive_expiry"]
+        )
 
-            # Check for common localhost patterns
-            if hostname in ["localhost", "127.0.0.1", "::1"]:
-                return True
+        return _build_limits(max_connections, max_keepalive, keepalive_expiry)
 
-            # Check for private network ranges (local network)
-            if hostname:
-                try:
-                    ip = ipaddress.ip_address(hostname)
-                    return ip.is_private or ip.is_loopback
-                except ValueError:
-                    # Not an IP address, might be a hostname
-                    pass
+    def _should_use_http2(self) -> bool:
+        """Return True when requests should negotiate HTTP/2.
 
+        HTTP/2 requires the optional ``h2`` package and is only offered over
+        TLS, where ALPN falls back to HTTP/1.1 for servers that lack it.
+        """
+        if not _http2_available():
             return False
-        except Exception:
+        if not self.base_url:
+            # The OpenAI SDK default endpoint is HTTPS
+            return True
+        return self._parsed_base_url is not None and self._parsed_base_url.scheme == "https"
+
+    def _parse_base_url(self):
+        """Return the parsed base URL, or ``None`` when unset or unparseable.
+
+        Unparseable URLs are reported by :meth:`_validate_base_url`.
+        """
+        if not self.base_url:
+            return None
+        try:
+            return urlparse(self.base_url)
+        except ValueError:
+            return None
+
+    def _compute_is_local(self) -> bool:
+        """Return True when the parsed base URL targets localhost or a private network."""
+        if self._parsed_base_url is None:
+            return False
+        try:
+            return _is_local_hostname(self._parsed_base_url.hostname)
+        except ValueError:
             return False
 
+    def _is_localhost_url(self) -> bool:
+        """Check if the base URL points to localhost or local network.
+
+        Returns:
+            True if URL is localhost or local network, False otherwise
+        """
+        return self._is_local
+
     def _validate_base_url(self) -> None:
         """Validate base URL for security (SSRF protection).
 
@@ -234,7 +425,8 @@ class OpenAICompatibleProvider(ModelProvider):
             return
 
         try:
-            parsed = urlparse(self.base_url)
+            # Re-parsing only happens on the error path, to surface the parse failure
+            parsed = self._parsed_base_url or urlparse(self.base_url)
 
             # Check URL scheme - only allow http/https
             if parsed.scheme not in ("http", "https"):
@@ -257,23 +449,17 @@ class OpenAICompatibleProvider(ModelProvider):
     def client(self):
         """Lazy initialization of OpenAI client with security checks and timeout configuration."""
         if self._client is None:
-            import httpx
-
             proxy_env_vars = ["HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy"]
 
             with suppress_env_vars(*proxy_env_vars):
                 try:
                     # Create a custom httpx client that explicitly avoids proxy parameters
-                    timeout_config = (
-                        self.timeout_config
-                        if hasattr(self, "timeout_config") and self.timeout_config
-                        else httpx.Timeout(30.0)
-                    )
+                    timeout_config = self.timeout_config or httpx.Timeout(30.0)
 
                     # Create httpx client with minimal config to avoid proxy conflicts
                     # Note: proxies parameter was removed in httpx 0.28.0
                     # Check for test transport injection
-                    if hasattr(self, "_test_transport"):
+                    if self._test_transport is not None:
                         # Use custom transport for testing (HTTP recording/replay)
                         http_client = httpx.Client(
                             transport=self._test_transport,
@@ -281,11 +467,8 @@ class OpenAICompatibleProvider(ModelProvider):
                             follow_redirects=True,
                         )
                     else:
-                        # Normal production client
-                        http_client = httpx.Client(
-                            timeout=timeout_config,
-                            follow_redirects=True,
-                        )
+                        # Normal production client, shared across provider instances
+                        http_client = get_shared_http_client(timeout_config, self.pool_limits, self.use_http2)
 
                     # Keep client initialization minimal to avoid proxy parameter conflicts
                     client_kwargs = {
@@ -368,14 +551,19 @@ class OpenAICompatibleProvider(ModelProvider):
         Raises:
             ValueError: If output_text is missing, None, or not a string
         """
-        logging.debug(f"Response object type: {type(response)}")
-        logging.debug(f"Response attributes: {dir(response)}")
+        # dir() builds and sorts the full attribute list, so only pay for it when debugging
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Response object type: %s", type(response))
+            logging.debug("Response attributes: %s", dir(response))
 
-        if not hasattr(response, "output_text"):
-            raise ValueError(f"o3-pro response missing output_text field. Response type: {type(response).__name__}")
+        try:
+            content = response.output_text
+        except AttributeError:
+            raise ValueError(
+                f"o3-pro response missing output_text field. Response type: {type(response).__name__}"
+            ) from None
 
-        content = response.output_text
-        logging.debug(f"Extracted output_text: '{content}' (type: {type(content)})")
+        logging.debug("Extracted output_text: '%s' (type: %s)", content, type(content))
 
         if content is None:
             raise ValueError("o3-pro returned None for output_text")
@@ -397,19 +585,16 @@ class OpenAICompatibleProvider(ModelProvider):
         """Generate content using the /v1/responses endpoint for reasoning models."""
         # Convert messages to the correct format for responses endpoint
         input_messages = []
+        role_map = self._RESPONSES_ROLE_MAP
 
         for message in messages:
-            role = message.get("role", "")
-            content = message.get("content", "")
-
-            if role == "system":
-                # For o3-pro, system messages should be handled carefully to avoid policy violations
-                # Instead of prefixing with "System:", we'll include the system content naturally
-                input_messages.append({"role": "user", "content": [{"type": "input_text", "text": content}]})
-            elif role == "user":
-                input_messages.append({"role": "user", "content": [{"type": "input_text", "text": content}]})
-            elif role == "assistant":
-                input_messages.append({"role": "assistant", "content": [{"type": "output_text", "text": content}]})
+            mapping = role_map.get(message.get("role", ""))
+            if mapping is None:
+                continue
+            role, content_type = mapping
+            input_messages.append(
+                {"role": role, "content": [{"type": content_type, "text": message.get("content", "")}]}
+            )
 
         # Prepare completion parameters for responses endpoint
         # Based on OpenAI documentation, use nested reasoning object for responses endpoint
@@ -428,6 +613,10 @@ class OpenAICompatibleProvider(ModelProvider):
         if max_output_tokens:
             completion_params["max_completion_tokens"] = max_output_tokens
 
+        # Reasoning models resend the same system prompt every turn, so share a prompt-cache shard across calls
+        if capabilities and capabilities.supports_prompt_caching and messages and messages[0].get("role") == "system":
+            completion_params["extra_body"] = {"prompt_cache_key": _prompt_cache_key(messages[0]["content"])}
+
         # For responses endpoint, we only add parameters that are explicitly supported
         # Remove unsupported chat completion parameters that may cause API errors
 
@@ -436,15 +625,15 @@ class OpenAICompatibleProvider(ModelProvider):
         retry_delays = [1, 3, 5, 8]
         attempt_counter = {"value": 0}
 
-        def _attempt() -> ModelResponse:
-            attempt_counter["value"] += 1
-            import json
-
+        # The request is identical on every attempt, so sanitize and serialize it once (and only if logged)
+        if logging.getLogger().isEnabledFor(logging.INFO):
             sanitized_params = self._sanitize_for_logging(completion_params)
             logging.info(
-                f"o3-pro API request (sanitized): {json.dumps(sanitized_params, indent=2, ensure_ascii=False)}"
+                "o3-pro API request (sanitized): %s", json.dumps(sanitized_params, indent=2, ensure_ascii=False)
             )
 
+        def _attempt() -> ModelResponse:
+            attempt_counter["value"] += 1
             response = self.client.responses.create(**completion_params)
 
             content = self._safe_extract_output_text(response)
@@ -466,7 +655,7 @@ class OpenAICompatibleProvider(ModelProvider):
                 usage=usage,
                 model_name=model_name,
                 friendly_name=self.FRIENDLY_NAME,
-                provider=self.get_provider_type(),
+                provider=self._provider_type,
                 metadata={
                     "model": getattr(response, "model", model_name),
                     "id": getattr(response, "id", ""),
@@ -507,11 +696,13 @@ class OpenAICompatibleProvider(ModelProvider):
             temperature: Sampling temperature
             max_output_tokens: Maximum tokens to generate
             images: Optional list of image paths or data URLs to include with the prompt (for vision models)
-            **kwargs: Additional provider-specific parameters
+            **kwargs: Additional provider-specific parameters; ``no_cache=True`` bypasses the response cache
 
         Returns:
             ModelResponse with generated content and metadata
         """
+        no_cache = kwargs.pop("no_cache", False)
+
         # Validate model name against allow-list
         if not self.validate_model_name(model_name):
             raise ValueError(f"Model '{model_name}' not in allowed models list. Allowed models: {self.allowed_models}")
@@ -520,7 +711,7 @@ class OpenAICompatibleProvider(ModelProvider):
         try:
             capabilities = self.get_capabilities(model_name)
         except Exception as exc:
-            logging.debug(f"Falling back to generic capabilities for {model_name}: {exc}")
+            logging.debug("Falling back to generic capabilities for %s: %s", model_name, exc)
             capabilities = None
 
         # Get effective temperature for this model from capabilities when available
@@ -528,7 +719,7 @@ class OpenAICompatibleProvider(ModelProvider):
             effective_temperature = capabilities.get_effective_temperature(temperature)
             if effective_temperature is not None and effective_temperature != temperature:
                 logging.debug(
-                    f"Adjusting temperature from {temperature} to {effective_temperature} for model {model_name}"
+                    "Adjusting temperature from %s to %s for model %s", temperature, effective_temperature, model_name
                 )
         else:
             effective_temperature = temperature
@@ -546,35 +737,15 @@ class OpenAICompatibleProvider(ModelProvider):
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
 
-        # Prepare user message with text and potentially images
-        user_content = []
-        user_content.append({"type": "text", "text": prompt})
-
-        # Add images if provided and model supports vision
-        if images and capabilities and capabilities.supports_images:
-            for image_path in images:
-                try:
-                    image_content = self._process_image(image_path)
-                    if image_content:
-                        user_content.append(image_content)
-                except Exception as e:
-                    logging.warning(f"Failed to process image {image_path}: {e}")
-                    # Continue with other images and text
-                    continue
-        elif images and (not capabilities or not capabilities.supports_images):
-            logging.warning(f"Model {resolved_model} does not support images, ignoring {len(images)} image(s)")
-
-        # Add user message
-        if len(user_content) == 1:
-            # Only text content, use simple string format for compatibility
-            messages.append({"role": "user", "content": prompt})
+        # Add user message; text-only prompts (the common case) skip the content array entirely
+        if images:
+            messages.append(self._build_user_message(prompt, images, capabilities, resolved_model))
         else:
-            # Text + images, use content array format
-            messages.append({"role": "user", "content": user_content})
+            messages.append({"role": "user", "content": prompt})
 
         # Prepare completion parameters
-        # Always disable streaming for OpenRouter
-        # MCP doesn't use streaming, and this avoids issues with O3 model access
+        # Disable streaming by default (MCP doesn't stream, and this avoids issues with O3 model access);
+        # callers that pass stream=True get the chunks accumulated into one response
         completion_params = {
             "model": resolved_model,
             "messages": messages,
@@ -601,6 +772,15 @@ class OpenAICompatibleProvider(ModelProvider):
                     continue  # Skip unsupported parameters for reasoning models
                 completion_params[key] = value
 
+        # Usage is only reported on the final streamed chunk when explicitly requested
+        if completion_params.get("stream"):
+            completion_params.setdefault("stream_options", {"include_usage": True})
+
+        # Let OpenAI route requests that share a system prompt to the same prompt-cache shard.
+        # Sent via extra_body so older SDK versions without the named argument still work.
+        if system_prompt and capabilities and capabilities.supports_prompt_caching:
+            completion_params["extra_body"] = {"prompt_cache_key": _prompt_cache_key(system_prompt)}
+
         # Check if this model needs the Responses API endpoint
         # Prefer capability metadata; fall back to static map when capabilities unavailable
         use_responses_api = False
@@ -632,6 +812,9 @@ class OpenAICompatibleProvider(ModelProvider):
             attempt_counter["value"] += 1
             response = self.client.chat.completions.create(**completion_params)
 
+            if completion_params.get("stream"):
+                return self._collect_streamed_response(response, resolved_model)
+
             content = response.choices[0].message.content
             usage = self._extract_usage(response)
 
@@ -640,7 +823,7 @@ class OpenAICompatibleProvider(ModelProvider):
                 usage=usage,
                 model_name=resolved_model,
                 friendly_name=self.FRIENDLY_NAME,
-                provider=self.get_provider_type(),
+                provider=self._provider_type,
                 metadata={
                     "finish_reason": response.choices[0].finish_reason,
                     "model": response.model,
@@ -649,8 +832,18 @@ class OpenAICompatibleProvider(ModelProvider):
                 },
             )
 
+        # Deterministic text-only requests can be answered from the exact-match cache;
+        # the serialized request covers the model, messages and every sampling parameter
+        cache_key = None
+        if effective_temperature == 0 and not images and not no_cache:
+            cache_key = ResponseCache.make_key(json.dumps(completion_params, sort_keys=True, default=str))
+            cached_response = self._response_cache.get(cache_key)
+            if cached_response is not None:
+                logging.debug("Serving %s response from exact-match cache", resolved_model)
+                return cached_response
+
         try:
-            return self._run_with_retries(
+            model_response = self._run_with_retries(
                 operation=_attempt,
                 max_attempts=max_retries,
                 delays=retry_delays,
@@ -665,6 +858,90 @@ class OpenAICompatibleProvider(ModelProvider):
             logging.error(error_msg)
             raise RuntimeError(error_msg) from exc
 
+        if cache_key is not None and model_response.content:
+            self._response_cache.put(cache_key, model_response)
+
+        return model_response
+
+    def _collect_streamed_response(self, stream, resolved_model: str) -> ModelResponse:
+        """Accumulate a streamed chat completion into a single ModelResponse.
+
+        Deltas are joined once at the end rather than concatenated per chunk.
+        Usage is only present when the endpoint reports it on the final chunk.
+        """
+        parts: list[str] = []
+        usage: dict[str, int] = {}
+        finish_reason = None
+        model = response_id = created = None
+
+        for chunk in stream:
+            if response_id is None:
+                model = getattr(chunk, "model", None)
+                response_id = getattr(chunk, "id", None)
+                created = getattr(chunk, "created", None)
+
+            if getattr(chunk, "usage", None):
+                usage = self._extract_usage(chunk)
+
+            if not chunk.choices:
+                continue
+
+            choice = chunk.choices[0]
+            delta_content = getattr(choice.delta, "content", None)
+            if delta_content:
+                parts.append(delta_content)
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+
+        return ModelResponse(
+            content="".join(parts),
+            usage=usage,
+            model_name=resolved_model,
+            friendly_name=self.FRIENDLY_NAME,
+            provider=self._provider_type,
+            metadata={
+                "finish_reason": finish_reason,
+                "model": model,
+                "id": response_id,
+                "created": created,
+                "streamed": True,
+            },
+        )
+
+    def _build_user_message(
+        self,
+        prompt: str,
+        images: list[str],
+        capabilities: Optional[ModelCapabilities],
+        resolved_model: str,
+    ) -> dict:
+        """Build the user message for a prompt that came with images.
+
+        Falls back to the plain string form when the model lacks vision support
+        or none of the images could be processed.
+        """
+        if not capabilities or not capabilities.supports_images:
+            logging.warning("Model %s does not support images, ignoring %d image(s)", resolved_model, len(images))
+            return {"role": "user", "content": prompt}
+
+        user_content = [{"type": "text", "text": prompt}]
+        for image_path in images:
+            try:
+                image_content = self._process_image(image_path)
+                if image_content:
+                    user_content.append(image_content)
+            except Exception as e:
+                logging.warning("Failed to process image %s: %s", image_path, e)
+                # Continue with other images and text
+                continue
+
+        if len(user_content) == 1:
+            # Only text content, use simple string format for compatibility
+            return {"role": "user", "content": prompt}
+
+        # Text + images, use content array format
+        return {"role": "user", "content": user_content}
+
     def validate_parameters(self, model_name: str, temperature: float, **kwargs) -> None:
         """Validate model parameters.
 
@@ -681,7 +958,7 @@ class OpenAICompatibleProvider(ModelProvider):
             # Check if we're using generic capabilities
             if hasattr(capabilities, "_is_generic"):
                 logging.debug(
-                    f"Using generic parameter validation for {model_name}. Actual model constraints may differ."
+                    "Using generic parameter validation for %s. Actual model constraints may differ.", model_name
                 )
 
             # Validate temperature using parent class method
@@ -690,7 +967,7 @@ class OpenAICompatibleProvider(ModelProvider):
         except Exception as e:
             # For proxy providers, we might not have accurate capabilities
             # Log warning but don't fail
-            logging.warning(f"Parameter validation limited for {model_name}: {e}")
+            logging.warning("Parameter validation limited for %s: %s", model_name, e)
 
     def _extract_usage(self, response) -> dict[str, int]:
         """Extract token usage from OpenAI response.
@@ -701,32 +978,29 @@ class OpenAICompatibleProvider(ModelProvider):
         Returns:
             Dictionary with usage statistics
         """
-        usage = {}
-
-        if hasattr(response, "usage") and response.usage:
-            # Safely extract token counts with None handling
-            usage["input_tokens"] = getattr(response.usage, "prompt_tokens", 0) or 0
-            usage["output_tokens"] = getattr(response.usage, "completion_tokens", 0) or 0
-            usage["total_tokens"] = getattr(response.usage, "total_tokens", 0) or 0
-
-        return usage
+        usage_obj = getattr(response, "usage", None)
+        if not usage_obj:
+            return {}
+
+        # Safely extract token counts with None handling
+        return {
+            "input_tokens": getattr(usage_obj, "prompt_tokens", 0) or 0,
+            "output_tokens": getattr(usage_obj, "completion_tokens", 0) or 0,
+            "total_tokens": getattr(usage_obj, "total_tokens", 0) or 0,
+        }
 
     def count_tokens(self, text: str, model_name: str) -> int:
         """Count tokens using OpenAI-compatible tokenizer tables when available."""
 
+        if tiktoken is None:
+            return super().count_tokens(text, model_name)
+
         resolved_model = self._resolve_model_name(model_name)
 
         try:
-            import tiktoken
-
-            try:
-                encoding = tiktoken.encoding_for_model(resolved_model)
-            except KeyError:
-                encoding = tiktoken.get_encoding("cl100k_base")
-
-            return len(encoding.encode(text))
-
-        except (ImportError, Exception) as exc:
+            return len(_get_tiktoken_encoding(resolved_model).encode(text))
+        except Exception as exc:
+            # Encodings are fetched on first use, so offline hosts can still fail here
             logging.debug("tiktoken unavailable for %s: %s", resolved_model, exc)
 
         return super().count_tokens(text, model_name)
@@ -742,10 +1016,16 @@ class OpenAICompatibleProvider(ModelProvider):
         Returns:
             True if error should be retried, False otherwise
         """
-        error_str = str(error).lower()
+        # Typed SDK errors carry the answer directly; 429s still need the payload inspected below
+        if isinstance(error, self._RETRYABLE_ERROR_TYPES):
+            return True
+        if isinstance(error, APIStatusError) and error.status_code != 429:
+            return error.status_code in self._RETRYABLE_STATUS_CODES
+
+        error_str = str(error)
 
         # Check for 429 errors first - these need special handling
-        if "429" in error_str:
+        if self._RATE_LIMIT_PATTERN.search(error_str):
             # Try to extract structured error information
             error_type = None
             error_code = None
@@ -753,13 +1033,8 @@ class OpenAICompatibleProvider(ModelProvider):
             # Parse structured error from OpenAI API response
             # Format: "Error code: 429 - {'error': {'type': 'tokens', 'code': 'rate_limit_exceeded', ...}}"
             try:
-                import ast
-                import json
-                import re
-
-                # Extract JSON part from error string using regex
-                # Look for pattern: {...} (from first { to last })
-                json_match = re.search(r"\{.*\}", str(error))
+                # Extract JSON part from error string (from first { to last })
+                json_match = self._ERROR_PAYLOAD_PATTERN.search(error_str)
                 if json_match:
                     json_like_str = json_match.group(0)
 
@@ -792,35 +1067,19 @@ class OpenAICompatibleProvider(ModelProvider):
             # Determine if 429 is retryable based on structured error codes
             if error_type == "tokens":
                 # Token-related 429s are typically non-retryable (request too large)
-                logging.debug(f"Non-retryable 429: token-related error (type={error_type}, code={error_code})")
+                logging.debug("Non-retryable 429: token-related error (type=%s, code=%s)", error_type, error_code)
                 return False
             elif error_code in ["invalid_request_error", "context_length_exceeded"]:
                 # These are permanent failures
-                logging.debug(f"Non-retryable 429: permanent failure (type={error_type}, code={error_code})")
+                logging.debug("Non-retryable 429: permanent failure (type=%s, code=%s)", error_type, error_code)
                 return False
             else:
                 # Other 429s (like requests per minute) are retryable
-                logging.debug(f"Retryable 429: rate limiting (type={error_type}, code={error_code})")
+                logging.debug("Retryable 429: rate limiting (type=%s, code=%s)", error_type, error_code)
                 return True
 
         # For non-429 errors, check if they're retryable
-        retryable_indicators = [
-            "timeout",
-            "connection",
-            "network",
-            "temporary",
-            "unavailable",
-            "retry",
-            "408",  # Request timeout
-            "500",  # Internal server error
-            "502",  # Bad gateway
-            "503",  # Service unavailable
-            "504",  # Gateway timeout
-            "ssl",  # SSL errors
-            "handshake",  # Handshake failures
-        ]
-
-        return any(indicator in error_str for indicator in retryable_indicators)
+        return self._RETRYABLE_PATTERN.search(error_str) is not None
 
     def _process_image(self, image_path: str) -> Optional[dict]:
         """Process an image for OpenAI-compatible API."""
@@ -834,14 +1093,11 @@ class OpenAICompatibleProvider(ModelProvider):
                 # Use base class validation
                 image_bytes, mime_type = validate_image(image_path)
 
-                # Read and encode the image
-                import base64
-
-                image_data = base64.b64encode(image_bytes).decode()
-                logging.debug(f"Processing image '{image_path}' as MIME type '{mime_type}'")
+                # Encode the validated bytes; base64 output is pure ASCII
+                logging.debug("Processing image '%s' as MIME type '%s'", image_path, mime_type)
 
                 # Create data URL for OpenAI API
-                data_url = f"data:{mime_type};base64,{image_data}"
+                data_url = f"data:{mime_type};base64,{base64.b64encode(image_bytes).decode('ascii')}"
 
                 return {"type": "image_url", "image_url": {"url": data_url}}
 
@@ -849,5 +1105,5 @@ class OpenAICompatibleProvider(ModelProvider):
             logging.warning(str(e))
             return None
         except Exception as e:
-            logging.error(f"Error processing image {image_path}: {e}")
+            logging.error("Error processing image %s: %s", image_path, e)
             return None
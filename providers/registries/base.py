@@ -69,14 +69,10 @@ class CustomModelRegistryBase:
         return list(self.alias_map.keys())
 
     def resolve(self, name_or_alias: str) -> ModelCapabilities | None:
-        key = name_or_alias.lower()
-        canonical = self.alias_map.get(key)
+        # alias_map also indexes every lowercased model name, so a miss here is final
+        canonical = self.alias_map.get(name_or_alias.lower())
         if canonical:
             return self.model_map.get(canonical)
-
-        for model_name in self.model_map:
-            if model_name.lower() == key:
-                return self.model_map[model_name]
         return None
 
     def get_capabilities(self, name_or_alias: str) -> ModelCapabilities | None:
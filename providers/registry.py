@@ -45,6 +45,17 @@ class ModelProviderRegistry:
         ProviderType.OPENROUTER,  # Catch-all for cloud models
     ]
 
+    # Environment variable holding each provider's API key
+    API_KEY_ENV_VARS = {
+        ProviderType.GOOGLE: "GEMINI_API_KEY",
+        ProviderType.OPENAI: "OPENAI_API_KEY",
+        ProviderType.AZURE: "AZURE_OPENAI_API_KEY",
+        ProviderType.XAI: "XAI_API_KEY",
+        ProviderType.OPENROUTER: "OPENROUTER_API_KEY",
+        ProviderType.CUSTOM: "CUSTOM_API_KEY",  # Can be empty for providers that don't need auth
+        ProviderType.DIAL: "DIAL_API_KEY",
+    }
+
     def __new__(cls):
         """Singleton pattern for registry."""
         if cls._instance is None:
@@ -53,6 +64,8 @@ class ModelProviderRegistry:
             # Initialize instance dictionaries on first creation
             cls._instance._providers = {}
             cls._instance._initialized_providers = {}
+            # Model name -> provider type that last served it, so repeat lookups skip the priority scan
+            cls._instance._model_routes = {}
             logging.debug(f"REGISTRY: Created instance {cls._instance}")
         return cls._instance
 
@@ -68,6 +81,7 @@ class ModelProviderRegistry:
         instance._providers[provider_type] = provider_class
         # Invalidate any cached instance so subsequent lookups use the new registration
         instance._initialized_providers.pop(provider_type, None)
+        instance._model_routes.clear()
 
     @classmethod
     def get_provider(cls, provider_type: ProviderType, force_new: bool = False) -> Optional[ModelProvider]:
@@ -165,27 +179,39 @@ class ModelProviderRegistry:
         Returns:
             ModelProvider instance that supports this model
         """
-        logging.debug(f"get_provider_for_model called with model_name='{model_name}'")
+        logging.debug("get_provider_for_model called with model_name='%s'", model_name)
 
         # Check providers in priority order
         instance = cls()
-        logging.debug(f"Registry instance: {instance}")
-        logging.debug(f"Available providers in registry: {list(instance._providers.keys())}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Registry instance: %s", instance)
+            logging.debug("Available providers in registry: %s", list(instance._providers.keys()))
+
+        # Fast path: re-check the provider that served this name last time
+        routes = instance._model_routes
+        routed_type = routes.get(model_name)
+        if routed_type is not None and routed_type in instance._providers:
+            provider = cls.get_provider(routed_type)
+            if provider and provider.validate_model_name(model_name):
+                logging.debug("%s validates model %s (cached route)", routed_type, model_name)
+                return provider
+            routes.pop(model_name, None)
 
         for provider_type in cls.PROVIDER_PRIORITY_ORDER:
             if provider_type in instance._providers:
-                logging.debug(f"Found {provider_type} in registry")
+                logging.debug("Found %s in registry", provider_type)
                 # Get or create provider instance
                 provider = cls.get_provider(provider_type)
                 if provider and provider.validate_model_name(model_name):
-                    logging.debug(f"{provider_type} validates model {model_name}")
+                    logging.debug("%s validates model %s", provider_type, model_name)
+                    routes[model_name] = provider_type
                     return provider
                 else:
-                    logging.debug(f"{provider_type} does not validate model {model_name}")
+                    logging.debug("%s does not validate model %s", provider_type, model_name)
             else:
-                logging.debug(f"{provider_type} not found in registry")
+                logging.debug("%s not found in registry", provider_type)
 
-        logging.debug(f"No provider found for model {model_name}")
+        logging.debug("No provider found for model %s", model_name)
         return None
 
     @classmethod
@@ -331,17 +357,7 @@ class ModelProviderRegistry:
         Returns:
             API key string or None if not found
         """
-        key_mapping = {
-            ProviderType.GOOGLE: "GEMINI_API_KEY",
-            ProviderType.OPENAI: "OPENAI_API_KEY",
-            ProviderType.AZURE: "AZURE_OPENAI_API_KEY",
-            ProviderType.XAI: "XAI_API_KEY",
-            ProviderType.OPENROUTER: "OPENROUTER_API_KEY",
-            ProviderType.CUSTOM: "CUSTOM_API_KEY",  # Can be empty for providers that don't need auth
-            ProviderType.DIAL: "DIAL_API_KEY",
-        }
-
-        env_var = key_mapping.get(provider_type)
+        env_var = cls.API_KEY_ENV_VARS.get(provider_type)
         if not env_var:
             return None
 
@@ -419,13 +435,16 @@ class ModelProviderRegistry:
 
                 if preferred_model:
                     logging.debug(
-                        f"Provider {provider_type.value} selected '{preferred_model}' for category '{effective_category.value}'"
+                        "Provider %s selected '%s' for category '%s'",
+                        provider_type.value,
+                        preferred_model,
+                        effective_category.value,
                     )
                     return preferred_model
 
         # If no provider returned a preference, use first available model
         if first_available_model:
-            logging.debug(f"No provider preference, using first available: {first_available_model}")
+            logging.debug("No provider preference, using first available: %s", first_available_model)
             return first_available_model
 
         # Ultimate fallback if no providers have models
@@ -451,6 +470,7 @@ class ModelProviderRegistry:
         """Clear cached provider instances."""
         instance = cls()
         instance._initialized_providers.clear()
+        instance._model_routes.clear()
 
     @classmethod
     def reset_for_testing(cls) -> None:
@@ -469,3 +489,4 @@ class ModelProviderRegistry:
         instance = cls()
         instance._providers.pop(provider_type, None)
         instance._initialized_providers.pop(provider_type, None)
+        instance._model_routes.clear()
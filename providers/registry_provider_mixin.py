@@ -31,6 +31,7 @@ class RegistryBackedProviderMixin:
 
     REGISTRY_CLASS: ClassVar[type[CapabilityModelRegistry] | None] = None
     _registry: ClassVar[CapabilityModelRegistry | None] = None
+    _registry_capabilities: ClassVar[dict[str, ModelCapabilities] | None] = None
     MODEL_CAPABILITIES: ClassVar[dict[str, ModelCapabilities]] = {}
 
     @classmethod
@@ -58,11 +59,13 @@ class RegistryBackedProviderMixin:
         except Exception as exc:  # pragma: no cover - registry failures shouldn't break the provider
             cls._registry_logger().warning("Unable to load %s registry: %s", cls.__name__, exc)
             cls._registry = None
+            cls._registry_capabilities = None
             cls.MODEL_CAPABILITIES = {}
             return
 
         cls._registry = registry
         cls.MODEL_CAPABILITIES = dict(registry.model_map)
+        cls._registry_capabilities = cls.MODEL_CAPABILITIES
 
     @classmethod
     def reload_registry(cls) -> None:
@@ -76,6 +79,25 @@ class RegistryBackedProviderMixin:
         self._ensure_registry()
         return super().get_all_model_capabilities()
 
+    def _resolve_model_name(self, model_name: str) -> str:
+        """Resolve aliases through the registry's prebuilt lowercase index.
+
+        Falls back to the generic scan when the registry is unavailable or the
+        capability map no longer matches it (tests may patch
+        ``MODEL_CAPABILITIES`` directly).
+        """
+
+        self._ensure_registry()
+        model_map = self.MODEL_CAPABILITIES
+        if model_name in model_map:
+            return model_name
+
+        registry = self._registry
+        if registry is not None and model_map is self._registry_capabilities:
+            return registry.alias_map.get(model_name.lower(), model_name)
+
+        return super()._resolve_model_name(model_name)
+
     def get_model_registry(self) -> dict[str, ModelCapabilities] | None:
         """Return a copy of the underlying registry map when available."""
 
@@ -3,6 +3,7 @@
 from .model_capabilities import ModelCapabilities
 from .model_response import ModelResponse
 from .provider_type import ProviderType
+from .response_cache import ResponseCache
 from .temperature import (
     DiscreteTemperatureConstraint,
     FixedTemperatureConstraint,
@@ -14,6 +15,7 @@ __all__ = [
     "ModelCapabilities",
     "ModelResponse",
     "ProviderType",
+    "ResponseCache",
     "TemperatureConstraint",
     "FixedTemperatureConstraint",
     "RangeTemperatureConstraint",
@@ -53,6 +53,7 @@ class ModelCapabilities:
     supports_json_mode: bool = False
     supports_temperature: bool = True
     use_openai_response_api: bool = False
+    supports_prompt_caching: bool = False
     default_reasoning_effort: Optional[str] = None
     allow_code_generation: bool = (
         False  # Enables structured code generation in chat tool for substantial implementations
@@ -0,0 +1,102 @@
+"""Exact-match cache for deterministic provider responses."""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Optional
+
+from utils.env import get_env
+
+from .model_response import ModelResponse
+
+__all__ = ["ResponseCache"]
+
+
+class ResponseCache:
+    """Bounded LRU cache of :class:`ModelResponse` objects.
+
+    Providers use this for requests whose output is expected to be
+    reproducible (temperature 0, text only), so a repeated identical call can
+    be answered without another API round-trip. Entries are keyed on a digest
+    of every request parameter that affects the output, and callers receive a
+    copy flagged with ``metadata["cache_hit"] = True``. Hits report zero token
+    usage since no tokens were billed; the original counts are kept under
+    ``metadata["cached_usage"]``.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[bytes, tuple[float, ModelResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        """Build a cache sized by ``ZEN_RESPONSE_CACHE_SIZE`` and ``ZEN_RESPONSE_CACHE_TTL``.
+
+        Defaults to 256 entries that expire after an hour. A size of 0 disables
+        caching; individual calls can also opt out with ``no_cache=True``.
+        """
+
+        size_raw = get_env("ZEN_RESPONSE_CACHE_SIZE")
+        ttl_raw = get_env("ZEN_RESPONSE_CACHE_TTL")
+        max_entries = int(size_raw) if size_raw else 256
+        ttl_seconds = float(ttl_raw) if ttl_raw else 3600.0
+        return cls(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    @staticmethod
+    def make_key(*parts: object) -> bytes:
+        """Return a compact digest identifying a request.
+
+        Parts are JSON-encoded as a list, so ``None`` stays distinct from ``""``
+        and field boundaries cannot be confused.
+        """
+
+        payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[ModelResponse]:
+        """Return a copy of the cached response for ``key``, or ``None``."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            stored_at, response = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+        return replace(
+            response,
+            usage=dict.fromkeys(response.usage, 0),
+            metadata={**response.metadata, "cache_hit": True, "cached_usage": dict(response.usage)},
+        )
+
+    def put(self, key: bytes, response: ModelResponse) -> None:
+        """Store ``response`` under ``key``, evicting the oldest entry when full."""
+
+        if self.max_entries <= 0:
+            return
+
+        stored = replace(response, usage=dict(response.usage), metadata=dict(response.metadata))
+        with self._lock:
+            self._entries[key] = (time.monotonic(), stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
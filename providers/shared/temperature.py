@@ -1,6 +1,7 @@
 """Helper types for validating model temperature parameters."""
 
 from abc import ABC, abstractmethod
+from functools import cache
 from typing import Optional
 
 __all__ = [
@@ -116,16 +117,13 @@ class TemperatureConstraint(ABC):
 
     @staticmethod
     def create(constraint_type: str) -> "TemperatureConstraint":
-        """Factory that yields the appropriate constraint for a configuration hint."""
+        """Factory that yields the appropriate constraint for a configuration hint.
 
-        if constraint_type == "fixed":
-            # Fixed temperature models (O3/O4) only support temperature=1.0
-            return FixedTemperatureConstraint(1.0)
-        if constraint_type == "discrete":
-            # For models with specific allowed values - using common OpenAI values as default
-            return DiscreteTemperatureConstraint([0.0, 0.3, 0.7, 1.0, 1.5, 2.0], 0.3)
-        # Default range constraint (for "range" or None)
-        return RangeTemperatureConstraint(0.0, 2.0, 0.3)
+        Constraints are never mutated after construction, so each hint maps to
+        a single shared instance rather than a fresh object per model entry.
+        """
+
+        return _create_constraint(constraint_type)
 
 
 class FixedTemperatureConstraint(TemperatureConstraint):
@@ -186,3 +184,15 @@ class DiscreteTemperatureConstraint(TemperatureConstraint):
 
     def get_default(self) -> float:
         return self.default_temp
+
+
+@cache
+def _create_constraint(constraint_type: Optional[str]) -> TemperatureConstraint:
+    if constraint_type == "fixed":
+        # Fixed temperature models (O3/O4) only support temperature=1.0
+        return FixedTemperatureConstraint(1.0)
+    if constraint_type == "discrete":
+        # For models with specific allowed values - using common OpenAI values as default
+        return DiscreteTemperatureConstraint([0.0, 0.3, 0.7, 1.0, 1.5, 2.0], 0.3)
+    # Default range constraint (for "range" or None)
+    return RangeTemperatureConstraint(0.0, 2.0, 0.3)
@@ -375,6 +375,60 @@ PROMPT_TEMPLATES = {
 }
 
 
+def build_prompt_catalog(tools: dict[str, Any]) -> tuple[Prompt, ...]:
+    """
+    Build the prompt list advertised to MCP clients.
+
+    The catalogue only depends on the enabled tools and PROMPT_TEMPLATES, both of
+    which are fixed once the module is imported, so it is built a single time and
+    reused for every prompts/list request.
+
+    Args:
+        tools: Dictionary of enabled tool instances
+
+    Returns:
+        Tuple of Prompt objects (one per tool plus the special "continue" prompt)
+    """
+    prompts = []
+
+    # Add a prompt for each tool with rich templates
+    for tool_name, tool in tools.items():
+        if tool_name in PROMPT_TEMPLATES:
+            # Use the rich template
+            template_info = PROMPT_TEMPLATES[tool_name]
+            prompts.append(
+                Prompt(
+                    name=template_info["name"],
+                    description=template_info["description"],
+                    arguments=[],  # MVP: no structured args
+                )
+            )
+        else:
+            # Fallback for any tools without templates (shouldn't happen)
+            prompts.append(
+                Prompt(
+                    name=tool_name,
+                    description=f"Use {tool.name} tool",
+                    arguments=[],
+                )
+            )
+
+    # Add special "continue" prompt
+    prompts.append(
+        Prompt(
+            name="continue",
+            description="Continue the previous conversation using the chat tool",
+            arguments=[],
+        )
+    )
+
+    return tuple(prompts)
+
+
+# Prompt catalogue served by handle_list_prompts (static for the lifetime of the process)
+PROMPT_CATALOG = build_prompt_catalog(TOOLS)
+
+
 def configure_providers():
     """
     Configure and validate AI providers based on available API keys.
@@ -391,15 +445,9 @@ def configure_providers():
     for key in api_keys_to_check:
         value = get_env(key)
         logger.debug(f"  {key}: {'[PRESENT]' if value else '[MISSING]'}")
+    # Concrete providers are imported only when configured, so unused vendor SDKs stay unloaded
     from providers import ModelProviderRegistry
-    from providers.azure_openai import AzureOpenAIProvider
-    from providers.custom import CustomProvider
-    from providers.dial import DIALModelProvider
-    from providers.gemini import GeminiModelProvider
-    from providers.openai import OpenAIModelProvider
-    from providers.openrouter import OpenRouterProvider
     from providers.shared import ProviderType
-    from providers.xai import XAIModelProvider
     from utils.model_restrictions import get_restriction_service
 
     valid_providers = []
@@ -498,28 +546,40 @@ def configure_providers():
 
     if has_native_apis:
         if gemini_key and gemini_key != "your_gemini_api_key_here":
+            from providers.gemini import GeminiModelProvider
+
             ModelProviderRegistry.register_provider(ProviderType.GOOGLE, GeminiModelProvider)
             registered_providers.append(ProviderType.GOOGLE.value)
             logger.debug(f"Registered provider: {ProviderType.GOOGLE.value}")
         if openai_key and openai_key != "your_openai_api_key_here":
+            from providers.openai import OpenAIModelProvider
+
             ModelProviderRegistry.register_provider(ProviderType.OPENAI, OpenAIModelProvider)
             registered_providers.append(ProviderType.OPENAI.value)
             logger.debug(f"Registered provider: {ProviderType.OPENAI.value}")
         if azure_models_available:
+            from providers.azure_openai import AzureOpenAIProvider
+
             ModelProviderRegistry.register_provider(ProviderType.AZURE, AzureOpenAIProvider)
             registered_providers.append(ProviderType.AZURE.value)
             logger.debug(f"Registered provider: {ProviderType.AZURE.value}")
         if xai_key and xai_key != "your_xai_api_key_here":
+            from providers.xai import XAIModelProvider
+
             ModelProviderRegistry.register_provider(ProviderType.XAI, XAIModelProvider)
             registered_providers.append(ProviderType.XAI.value)
             logger.debug(f"Registered provider: {ProviderType.XAI.value}")
         if dial_key and dial_key != "your_dial_api_key_here":
+            from providers.dial import DIALModelProvider
+
             ModelProviderRegistry.register_provider(ProviderType.DIAL, DIALModelProvider)
             registered_providers.append(ProviderType.DIAL.value)
             logger.debug(f"Registered provider: {ProviderType.DIAL.value}")
 
     # 2. Custom provider second (for local/private models)
     if has_custom:
+        from providers.custom import CustomProvider
+
         # Factory function that creates CustomProvider with proper parameters
         def custom_provider_factory(api_key=None):
             # api_key is CUSTOM_API_KEY (can be empty for Ollama), base_url from CUSTOM_API_URL
@@ -532,6 +592,8 @@ def configure_providers():
 
     # 3. OpenRouter last (catch-all for everything else)
     if has_openrouter:
+        from providers.openrouter import OpenRouterProvider
+
         ModelProviderRegistry.register_provider(ProviderType.OPENROUTER, OpenRouterProvider)
         registered_providers.append(ProviderType.OPENROUTER.value)
         logger.debug(f"Registered provider: {ProviderType.OPENROUTER.value}")
@@ -580,6 +642,10 @@ def configure_providers():
                     except Exception:
                         # Logger might be closed during shutdown
                         pass
+
+            from providers.openai_compatible import close_shared_http_clients
+
+            close_shared_http_clients()
         except Exception:
             # Silently ignore any errors during cleanup
             pass
@@ -627,6 +693,44 @@ def configure_providers():
             )
 
 
+def build_tool_catalog(tools: dict[str, Any]) -> tuple[Tool, ...]:
+    """
+    Build the MCP Tool descriptors for the enabled tools.
+
+    Input schemas embed the model catalogue (auto mode, restrictions), so this
+    must run after configure_providers(). Providers are fixed for the lifetime
+    of the process, which lets handle_list_tools build the catalogue on the
+    first request and reuse it afterwards.
+
+    Args:
+        tools: Dictionary of enabled tool instances
+
+    Returns:
+        Tuple of Tool objects in registry order
+    """
+    catalog = []
+
+    for tool in tools.values():
+        # Get optional annotations from the tool
+        annotations = tool.get_annotations()
+        tool_annotations = ToolAnnotations(**annotations) if annotations else None
+
+        catalog.append(
+            Tool(
+                name=tool.name,
+                description=tool.description,
+                inputSchema=tool.get_input_schema(),
+                annotations=tool_annotations,
+            )
+        )
+
+    return tuple(catalog)
+
+
+# Tool descriptors served by handle_list_tools, built lazily on the first tools/list request
+TOOL_CATALOG: Optional[tuple[Tool, ...]] = None
+
+
 @server.list_tools()
 async def handle_list_tools() -> list[Tool]:
     """
@@ -662,30 +766,20 @@ async def handle_list_tools() -> list[Tool]:
             except Exception:
                 pass
     except Exception as e:
-        logger.debug(f"Could not log client info during list_tools: {e}")
-    tools = []
-
-    # Add all registered AI-powered tools from the TOOLS registry
-    for tool in TOOLS.values():
-        # Get optional annotations from the tool
-        annotations = tool.get_annotations()
-        tool_annotations = ToolAnnotations(**annotations) if annotations else None
+        logger.debug("Could not log client info during list_tools: %s", e)
 
-        tools.append(
-            Tool(
-                name=tool.name,
-                description=tool.description,
-                inputSchema=tool.get_input_schema(),
-                annotations=tool_annotations,
-            )
-        )
+    global TOOL_CATALOG
+    if TOOL_CATALOG is None:
+        TOOL_CATALOG = build_tool_catalog(TOOLS)
+    tools = list(TOOL_CATALOG)
 
-    # Log cache efficiency info
-    openrouter_key_for_cache = get_env("OPENROUTER_API_KEY")
-    if openrouter_key_for_cache and openrouter_key_for_cache != "your_openrouter_api_key_here":
-        logger.debug("OpenRouter registry cache used efficiently across all tool schemas")
+    if logger.isEnabledFor(logging.DEBUG):
+        # Log cache efficiency info
+        openrouter_key_for_cache = get_env("OPENROUTER_API_KEY")
+        if openrouter_key_for_cache and openrouter_key_for_cache != "your_openrouter_api_key_here":
+            logger.debug("OpenRouter registry cache used efficiently across all tool schemas")
 
-    logger.debug(f"Returning {len(tools)} tools to MCP client")
+        logger.debug("Returning %d tools to MCP client", len(tools))
     return tools
 
 
@@ -1294,45 +1388,15 @@ async def handle_list_prompts() -> list[Prompt]:
     List all available prompts for CLI Code shortcuts.
 
     This handler returns prompts that enable shortcuts like /zen:thinkdeeper.
-    We automatically generate prompts from all tools (1:1 mapping) plus add
-    a few marketing aliases with richer templates for commonly used tools.
+    Prompts are generated from all tools (1:1 mapping) plus a few marketing
+    aliases with richer templates; the list is prebuilt in PROMPT_CATALOG at
+    import time so each request only copies it.
 
     Returns:
         List of Prompt objects representing all available prompts
     """
     logger.debug("MCP client requested prompt list")
-    prompts = []
-
-    # Add a prompt for each tool with rich templates
-    for tool_name, tool in TOOLS.items():
-        if tool_name in PROMPT_TEMPLATES:
-            # Use the rich template
-            template_info = PROMPT_TEMPLATES[tool_name]
-            prompts.append(
-                Prompt(
-                    name=template_info["name"],
-                    description=template_info["description"],
-                    arguments=[],  # MVP: no structured args
-                )
-            )
-        else:
-            # Fallback for any tools without templates (shouldn't happen)
-            prompts.append(
-                Prompt(
-                    name=tool_name,
-                    description=f"Use {tool.name} tool",
-                    arguments=[],
-                )
-            )
-
-    # Add special "continue" prompt
-    prompts.append(
-        Prompt(
-            name="continue",
-            description="Continue the previous conversation using the chat tool",
-            arguments=[],
-        )
-    )
+    prompts = list(PROMPT_CATALOG)
 
     logger.debug(f"Returning {len(prompts)} prompts to MCP client")
     return prompts
@@ -1513,10 +1577,33 @@ async def main():
         )
 
 
+def _get_event_loop_factory():
+    """
+    Return uvloop's event loop factory when it is installed, otherwise None.
+
+    uvloop is an optional dependency and does not support Windows, so the
+    default asyncio loop is used whenever it is unavailable.
+    """
+    if sys.platform == "win32":
+        return None
+
+    try:
+        import uvloop
+    except ImportError:
+        return None
+
+    return uvloop.new_event_loop
+
+
 def run():
     """Console script entry point for zen-mcp-server."""
     try:
-        asyncio.run(main())
+        if hasattr(asyncio, "Runner"):
+            # Python 3.11+: run the long-lived stdio server on uvloop when available
+            with asyncio.Runner(loop_factory=_get_event_loop_factory()) as runner:
+                runner.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         # Handle graceful shutdown
         pass
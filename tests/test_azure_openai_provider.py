@@ -143,3 +143,79 @@ def test_registry_configuration_merges_capabilities(dummy_azure_client, monkeypa
     # API call should use deployment defined in registry
     provider.generate_content("hello", "gpt-4o")
     assert dummy_azure_client["request_kwargs"]["model"] == "registry-deployment"
+
+
+def test_prompt_cache_key_sent_to_responses_endpoint(dummy_azure_client, monkeypatch):
+    provider = AzureOpenAIProvider(
+        api_key="key",
+        azure_endpoint="https://example.openai.azure.com/",
+        deployments={
+            "o3": {
+                "deployment": "prod-o3",
+                "use_openai_response_api": True,
+                "supports_prompt_caching": True,
+            }
+        },
+    )
+    monkeypatch.setattr(provider, "_safe_extract_output_text", lambda response: "hello")
+
+    provider.generate_content("first", "o3", system_prompt="Shared instructions")
+    first_key = dummy_azure_client["responses_kwargs"]["extra_body"]["prompt_cache_key"]
+    provider.generate_content("second", "o3", system_prompt="Shared instructions")
+
+    assert dummy_azure_client["responses_kwargs"]["model"] == "prod-o3"
+    assert dummy_azure_client["responses_kwargs"]["extra_body"]["prompt_cache_key"] == first_key
+
+
+def test_client_uses_shared_http_client_pool(dummy_azure_client):
+    from providers.openai_compatible import close_shared_http_clients
+
+    close_shared_http_clients()
+    first = AzureOpenAIProvider(
+        api_key="key",
+        azure_endpoint="https://example.openai.azure.com/",
+        deployments={"gpt-4o": "prod"},
+    )
+    _ = first.client
+    first_http_client = dummy_azure_client["client_kwargs"]["http_client"]
+
+    second = AzureOpenAIProvider(
+        api_key="other-key",
+        azure_endpoint="https://other.openai.azure.com/",
+        deployments={"gpt-4o": "prod"},
+    )
+    _ = second.client
+
+    try:
+        assert dummy_azure_client["client_kwargs"]["http_client"] is first_http_client
+    finally:
+        close_shared_http_clients()
+
+
+def test_aliases_resolve_to_deployment(dummy_azure_client):
+    provider = AzureOpenAIProvider(
+        api_key="key",
+        azure_endpoint="https://example.openai.azure.com/",
+        deployments={"gpt-4o": {"deployment": "prod-gpt4o", "aliases": "gpt4o-eu"}},
+    )
+
+    result = provider.generate_content("hello", "GPT4O-EU")
+
+    assert dummy_azure_client["request_kwargs"]["model"] == "prod-gpt4o"
+    assert result.model_name == "gpt-4o"
+    with pytest.raises(ValueError):
+        provider.generate_content("hello", "unknown-model")
+
+
+@pytest.mark.parametrize("model_name", ["gpt-4.1", "o3-mini"])
+def test_openai_template_does_not_enable_prompt_caching(dummy_azure_client, model_name):
+    provider = AzureOpenAIProvider(
+        api_key="key",
+        azure_endpoint="https://example.openai.azure.com/",
+        deployments={model_name: "prod"},
+    )
+
+    provider.generate_content("hello", model_name, system_prompt="Shared instructions")
+
+    assert provider.get_capabilities(model_name).supports_prompt_caching is False
+    assert "extra_body" not in dummy_azure_client["request_kwargs"]
@@ -265,8 +265,38 @@ class TestDIALProvider:
         # Assert that the shared httpx client's close method was called
         mock_shared_http_client.close.assert_called_once()
 
-        # Assert that the superclass client's close method was called
-        mock_superclass_client.close.assert_called_once()
+        # The superclass client shares the process-wide pool, so it must not be closed
+        mock_superclass_client.close.assert_not_called()
 
         # Assert that the deployment clients cache is cleared
         assert not provider._deployment_clients
+
+    @patch("openai.OpenAI")
+    def test_deployment_clients_do_not_build_superclass_client(self, mock_openai_class):
+        """Deployment routing and close() should never create the unused superclass client."""
+        provider = DIALModelProvider("test-key", base_url="https://test.dialx.ai/")
+
+        provider._get_deployment_client("o3-2025-04-16")
+        provider.close()
+
+        assert mock_openai_class.call_args[1]["base_url"] == "https://test.dialx.ai/openai/deployments/o3-2025-04-16"
+        assert provider._client is None
+
+    def test_close_leaves_shared_http_pool_open(self):
+        """Closing one provider must not close the pooled client other providers still use."""
+        from providers.openai_compatible import close_shared_http_clients
+
+        close_shared_http_clients()
+        provider = DIALModelProvider("test-key")
+        other = DIALModelProvider("other-key")
+
+        try:
+            shared_http_client = other.client._client
+            assert provider.client._client is shared_http_client
+
+            provider.close()
+
+            assert not shared_http_client.is_closed
+            assert not other.client._client.is_closed
+        finally:
+            close_shared_http_clients()
@@ -259,3 +259,18 @@ class TestProviderIntegration:
         assert result is not None
         assert result["type"] == "image_url"
         assert result["image_url"]["url"] == data_url
+
+    def test_gemini_image_part_uses_raw_bytes(self) -> None:
+        """Test that Gemini receives decoded image bytes rather than a base64 string."""
+        from google.genai import types
+
+        from providers.gemini import GeminiModelProvider
+
+        provider = GeminiModelProvider(api_key="test-key")
+        encoded = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+
+        result = provider._process_image(f"data:image/png;base64,{encoded}")
+
+        assert isinstance(result, types.Part)
+        assert result.inline_data.mime_type == "image/png"
+        assert result.inline_data.data == base64.b64decode(encoded)
@@ -237,3 +237,7 @@ class TestO3TemperatureParameterFixSimple:
         temp_constraint = gpt41_capabilities.temperature_constraint
         assert temp_constraint.validate(0.5) is True
         assert temp_constraint.validate(1.0) is True
+
+        # Models configured with the same hint share one constraint instance
+        o3_constraint = o3_capabilities.temperature_constraint
+        assert provider.get_capabilities("o4-mini").temperature_constraint is o3_constraint
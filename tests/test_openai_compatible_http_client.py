@@ -0,0 +1,127 @@
+"""Tests for the HTTP client configuration used by OpenAI-compatible providers."""
+
+from unittest.mock import Mock
+
+import pytest
+
+import providers.openai_compatible as openai_compatible
+from providers.openai_compatible import OpenAICompatibleProvider, close_shared_http_clients
+
+
+class _TestProvider(OpenAICompatibleProvider):
+    FRIENDLY_NAME = "Test"
+
+    def get_capabilities(self, model_name):
+        return Mock()
+
+    def get_provider_type(self):
+        return Mock()
+
+    def validate_model_name(self, model_name):
+        return True
+
+    def list_models(self, **kwargs):
+        return ["test-model"]
+
+
+@pytest.fixture(autouse=True)
+def _clear_pool_env(monkeypatch):
+    for name in ("ZEN_HTTPX_MAX_CONNECTIONS", "ZEN_HTTPX_MAX_KEEPALIVE_CONNECTIONS", "ZEN_HTTPX_KEEPALIVE_EXPIRY"):
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_pool_limits_use_class_defaults():
+    provider = _TestProvider("test-key")
+
+    assert provider.pool_limits.max_connections == 1000
+    assert provider.pool_limits.max_keepalive_connections == 100
+    assert provider.pool_limits.keepalive_expiry == 75.0
+
+
+def test_pool_limits_honour_env_overrides(monkeypatch):
+    monkeypatch.setenv("ZEN_HTTPX_MAX_CONNECTIONS", "50")
+    monkeypatch.setenv("ZEN_HTTPX_MAX_KEEPALIVE_CONNECTIONS", "20")
+    monkeypatch.setenv("ZEN_HTTPX_KEEPALIVE_EXPIRY", "30")
+
+    provider = _TestProvider("test-key")
+
+    assert provider.pool_limits.max_connections == 50
+    assert provider.pool_limits.max_keepalive_connections == 20
+    assert provider.pool_limits.keepalive_expiry == 30.0
+
+
+def test_providers_share_http_client_pool():
+    close_shared_http_clients()
+    first = _TestProvider("key-one", base_url="https://api.example.com/v1")
+    second = _TestProvider("key-two", base_url="https://other.example.com/v1")
+
+    try:
+        assert first.client._client is second.client._client
+    finally:
+        close_shared_http_clients()
+
+
+def test_close_shared_http_clients_rebuilds_on_next_use():
+    close_shared_http_clients()
+    provider = _TestProvider("test-key", base_url="https://api.example.com/v1")
+    http_client = provider.client._client
+
+    close_shared_http_clients()
+
+    assert http_client.is_closed
+    assert not openai_compatible._SHARED_HTTP_CLIENTS
+
+    fresh = _TestProvider("test-key", base_url="https://api.example.com/v1")
+    try:
+        assert fresh.client._client is not http_client
+    finally:
+        close_shared_http_clients()
+
+
+def test_test_transport_bypasses_shared_pool():
+    import httpx
+
+    close_shared_http_clients()
+    provider = _TestProvider("test-key", base_url="https://api.example.com/v1")
+    provider._test_transport = httpx.MockTransport(lambda request: httpx.Response(200))
+
+    assert provider.client is not None
+
+    assert not openai_compatible._SHARED_HTTP_CLIENTS
+
+
+def test_timeout_and_limits_objects_are_reused():
+    first = _TestProvider("key-one")
+    second = _TestProvider("key-two")
+
+    assert first.timeout_config is second.timeout_config
+    assert first.pool_limits is second.pool_limits
+
+
+def test_http2_enabled_for_https_endpoints_when_h2_installed(monkeypatch):
+    monkeypatch.setattr(openai_compatible, "_http2_available", lambda: True)
+
+    assert _TestProvider("test-key", base_url="https://api.example.com/v1").use_http2 is True
+    assert _TestProvider("test-key", base_url="http://localhost:11434/v1").use_http2 is False
+
+
+def test_http2_disabled_without_h2(monkeypatch):
+    monkeypatch.setattr(openai_compatible, "_http2_available", lambda: False)
+
+    assert _TestProvider("test-key", base_url="https://api.example.com/v1").use_http2 is False
+
+
+@pytest.mark.parametrize(
+    "base_url, expected",
+    [
+        ("http://localhost:11434/v1", True),
+        ("http://127.0.0.1:8000/v1", True),
+        ("http://192.168.1.20:8080/v1", True),
+        ("https://api.example.com/v1", False),
+        ("https://8.8.8.8/v1", False),
+    ],
+)
+def test_localhost_detection(base_url, expected):
+    provider = _TestProvider("test-key", base_url=base_url)
+
+    assert provider._is_localhost_url() is expected
@@ -1,8 +1,9 @@
 """Tests for OpenAI-compatible provider token usage extraction."""
 
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+import providers.openai_compatible as openai_compatible
 from providers.openai_compatible import OpenAICompatibleProvider
 
 
@@ -133,6 +134,30 @@ class TestOpenAICompatibleTokenUsage(unittest.TestCase):
         total = input_tokens + output_tokens
         self.assertEqual(total, 50)
 
+    def test_count_tokens_reuses_cached_encoding(self):
+        """Test that tiktoken encodings are resolved once per model."""
+        fake_encoding = Mock()
+        fake_encoding.encode.return_value = [1, 2, 3]
+        fake_tiktoken = Mock()
+        fake_tiktoken.encoding_for_model.side_effect = KeyError("unknown model")
+        fake_tiktoken.get_encoding.return_value = fake_encoding
+
+        openai_compatible._get_tiktoken_encoding.cache_clear()
+        try:
+            with patch.object(openai_compatible, "tiktoken", fake_tiktoken):
+                self.assertEqual(self.provider.count_tokens("hello world", "test-model"), 3)
+                self.assertEqual(self.provider.count_tokens("hello again", "test-model"), 3)
+        finally:
+            openai_compatible._get_tiktoken_encoding.cache_clear()
+
+        fake_tiktoken.encoding_for_model.assert_called_once_with("test-model")
+        fake_tiktoken.get_encoding.assert_called_once_with("cl100k_base")
+
+    def test_count_tokens_without_tiktoken_uses_estimate(self):
+        """Test the character heuristic when tiktoken is not installed."""
+        with patch.object(openai_compatible, "tiktoken", None):
+            self.assertEqual(self.provider.count_tokens("x" * 40, "test-model"), 10)
+
 
 if __name__ == "__main__":
     unittest.main()
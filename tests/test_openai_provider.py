@@ -387,3 +387,77 @@ class TestOpenAIProvider:
         # Verify the response
         assert result.content == "Test response"
         assert result.model_name == "o3-mini"
+
+    @patch("providers.openai_compatible.OpenAI")
+    def test_streamed_chat_completion_is_accumulated(self, mock_openai_class):
+        """Test that stream=True chunks are joined into a single response."""
+        from types import SimpleNamespace
+
+        def chunk(content, finish_reason=None, usage=None):
+            delta = SimpleNamespace(content=content)
+            return SimpleNamespace(
+                id="stream-id",
+                model="gpt-4.1",
+                created=1234567890,
+                usage=usage,
+                choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)],
+            )
+
+        usage = SimpleNamespace(prompt_tokens=10, completion_tokens=3, total_tokens=13)
+        final_usage_chunk = SimpleNamespace(
+            id="stream-id", model="gpt-4.1", created=1234567890, usage=usage, choices=[]
+        )
+
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value = iter(
+            [chunk("Hel"), chunk(None), chunk("lo", finish_reason="stop"), final_usage_chunk]
+        )
+
+        provider = OpenAIModelProvider("test-key")
+        result = provider.generate_content(prompt="Test prompt", model_name="gpt-4.1", temperature=0.5, stream=True)
+
+        assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
+        assert mock_client.chat.completions.create.call_args.kwargs["stream_options"] == {"include_usage": True}
+        assert result.content == "Hello"
+        assert result.metadata["finish_reason"] == "stop"
+        assert result.metadata["streamed"] is True
+        assert result.usage == {"input_tokens": 10, "output_tokens": 3, "total_tokens": 13}
+
+    def test_custom_registry_loaded_once_for_unknown_models(self, monkeypatch):
+        """Test that repeated lookups of non-built-in models reuse one custom registry."""
+        # Start from an empty cache and restore it afterwards so the mocked registry cannot leak
+        monkeypatch.setattr(OpenAIModelProvider, "_custom_registry", None)
+        monkeypatch.setattr(OpenAIModelProvider, "_custom_registry_key", None)
+        provider = OpenAIModelProvider("test-key")
+
+        with patch("providers.registries.openrouter.OpenRouterModelRegistry") as mock_registry_class:
+            mock_registry_class.return_value.get_model_config.return_value = None
+
+            assert provider._lookup_capabilities("custom-model-a") is None
+            assert provider._lookup_capabilities("custom-model-b") is None
+
+        mock_registry_class.assert_called_once()
+
+    @patch("providers.openai_compatible.OpenAI")
+    def test_prompt_cache_key_sent_for_supported_models(self, mock_openai_class):
+        """Test that models flagged for prompt caching get a stable key derived from the system prompt."""
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Test response"
+        mock_response.choices[0].finish_reason = "stop"
+        mock_response.usage = None
+        mock_client.chat.completions.create.return_value = mock_response
+
+        provider = OpenAIModelProvider("test-key")
+        provider.generate_content(prompt="First", model_name="gpt-4.1", system_prompt="Shared", temperature=0.5)
+        provider.generate_content(prompt="Second", model_name="gpt-4.1", system_prompt="Shared", temperature=0.5)
+        provider.generate_content(prompt="Third", model_name="gpt-4.1", temperature=0.5)
+
+        first, second, no_system = (call.kwargs for call in mock_client.chat.completions.create.call_args_list)
+        assert first["extra_body"]["prompt_cache_key"] == second["extra_body"]["prompt_cache_key"]
+        assert "extra_body" not in no_system
+
+        assert provider.get_capabilities("gpt-5").supports_prompt_caching is False
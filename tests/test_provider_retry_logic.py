@@ -71,3 +71,64 @@ def test_openai_provider_bails_on_non_retryable_error(monkeypatch):
 
     assert "after 1 attempt" in str(excinfo.value)
     assert attempts["count"] == 1
+
+
+def test_retry_delays_are_jittered_below_schedule(monkeypatch):
+    """Retry sleeps should be randomised but never exceed the configured delay."""
+
+    sleeps = []
+    monkeypatch.setattr("providers.base.time.sleep", sleeps.append)
+
+    provider = OpenAIModelProvider(api_key="test-key")
+
+    def always_fail():
+        raise RuntimeError("temporary network interruption")
+
+    with pytest.raises(RuntimeError):
+        provider._run_with_retries(always_fail, max_attempts=4, delays=[1, 3, 5])
+
+    assert len(sleeps) == 3
+    for slept, scheduled in zip(sleeps, [1, 3, 5]):
+        assert scheduled * (1 - provider.RETRY_JITTER) <= slept <= scheduled
+
+
+def test_retry_jitter_can_be_disabled(monkeypatch):
+    """Providers may opt out of jitter to keep the exact delay schedule."""
+
+    sleeps = []
+    monkeypatch.setattr("providers.base.time.sleep", sleeps.append)
+
+    provider = OpenAIModelProvider(api_key="test-key")
+    monkeypatch.setattr(provider, "RETRY_JITTER", 0)
+
+    def always_fail():
+        raise RuntimeError("temporary network interruption")
+
+    with pytest.raises(RuntimeError):
+        provider._run_with_retries(always_fail, max_attempts=3, delays=[1, 3])
+
+    assert sleeps == [1, 3]
+
+
+def test_retry_after_header_overrides_schedule(monkeypatch):
+    """A Retry-After hint on the error replaces the jittered schedule, capped by MAX_RETRY_AFTER."""
+
+    sleeps = []
+    monkeypatch.setattr("providers.base.time.sleep", sleeps.append)
+
+    provider = OpenAIModelProvider(api_key="test-key")
+    hints = iter(["2", "3600", "Wed, 21 Oct 2015 07:28:00 GMT", "1"])
+
+    class ThrottledError(RuntimeError):
+        def __init__(self, retry_after):
+            super().__init__("temporary network interruption")
+            self.response = SimpleNamespace(headers={"retry-after": retry_after})
+
+    def always_fail():
+        raise ThrottledError(next(hints))
+
+    monkeypatch.setattr(provider, "RETRY_JITTER", 0)
+    with pytest.raises(ThrottledError):
+        provider._run_with_retries(always_fail, max_attempts=4, delays=[1, 1, 7])
+
+    assert sleeps == [2.0, provider.MAX_RETRY_AFTER, 7]
@@ -402,3 +402,42 @@ class TestProviderMetadataBug:
         assert result.metadata["model_used"] == "test-model", "model_used should be correct"
         assert "provider_used" in result.metadata, "Metadata should include provider_used (bug fix)"
         assert result.metadata["provider_used"] == "openrouter", "provider_used should be correct"
+
+
+class TestModelRouteCache:
+    """Repeat lookups should go straight to the provider that served the model before."""
+
+    def setup_method(self):
+        ModelProviderRegistry.reset_for_testing()
+
+    def teardown_method(self):
+        ModelProviderRegistry.reset_for_testing()
+
+    def test_repeat_lookup_skips_higher_priority_providers(self):
+        gemini = Mock()
+        gemini.validate_model_name.return_value = False
+        openai = Mock()
+        openai.validate_model_name.return_value = True
+
+        ModelProviderRegistry.register_provider(ProviderType.GOOGLE, Mock())
+        ModelProviderRegistry.register_provider(ProviderType.OPENAI, Mock())
+        registry = ModelProviderRegistry()
+        registry._initialized_providers.update({ProviderType.GOOGLE: gemini, ProviderType.OPENAI: openai})
+
+        assert ModelProviderRegistry.get_provider_for_model("gpt-5") is openai
+        assert ModelProviderRegistry.get_provider_for_model("gpt-5") is openai
+        assert gemini.validate_model_name.call_count == 1
+
+        # A stale route falls back to the full priority scan
+        openai.validate_model_name.return_value = False
+        gemini.validate_model_name.return_value = True
+        assert ModelProviderRegistry.get_provider_for_model("gpt-5") is gemini
+
+    def test_registration_changes_clear_routes(self):
+        ModelProviderRegistry.register_provider(ProviderType.OPENAI, Mock())
+        registry = ModelProviderRegistry()
+        registry._model_routes["gpt-5"] = ProviderType.OPENAI
+
+        ModelProviderRegistry.unregister_provider(ProviderType.OPENAI)
+
+        assert registry._model_routes == {}
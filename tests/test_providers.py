@@ -151,6 +151,33 @@ class TestGeminiProvider:
         assert response.usage["output_tokens"] == 20
         assert response.usage["total_tokens"] == 30
 
+    @patch("google.genai.Client")
+    def test_generate_content_resolves_capabilities_once(self, mock_client_class):
+        """Alias resolution and capability lookup should happen once per request"""
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.text = "Generated content"
+        mock_response.candidates = [Mock(finish_reason="STOP")]
+        mock_response.usage_metadata = Mock(prompt_token_count=1, candidates_token_count=1)
+        mock_client.models.generate_content.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        provider = GeminiModelProvider(api_key="test-key")
+
+        with patch.object(provider, "get_capabilities", wraps=provider.get_capabilities) as get_capabilities:
+            response = provider.generate_content(prompt="Test prompt", model_name="flash", temperature=0.7)
+
+        assert get_capabilities.call_count == 1
+        assert response.model_name == "gemini-2.5-flash"
+        assert mock_client.models.generate_content.call_args.kwargs["model"] == "gemini-2.5-flash"
+
+    def test_generate_content_rejects_invalid_temperature(self):
+        """Temperature validation should still run against the resolved capabilities"""
+        provider = GeminiModelProvider(api_key="test-key")
+
+        with pytest.raises(ValueError, match="Temperature 5.0 is invalid"):
+            provider.generate_content(prompt="Test prompt", model_name="flash", temperature=5.0)
+
 
 class TestOpenAIProvider:
     """Test OpenAI model provider"""
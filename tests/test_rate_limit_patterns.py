@@ -72,6 +72,19 @@ def test_gemini_structured_error_retry_logic():
     assert provider._is_error_retryable(temp_error), "Temporary rate limiting should be retryable"
 
 
+def test_gemini_non_429_error_classification():
+    """Test Gemini provider's classification of transient and permanent non-429 errors."""
+    provider = GeminiModelProvider(api_key="test-key")
+
+    assert provider._is_error_retryable(Exception("503 Service Unavailable"))
+    assert provider._is_error_retryable(Exception("SSL handshake failed"))
+    assert provider._is_error_retryable(Exception("Read TIMEOUT while waiting for response"))
+
+    # Status codes must match as whole numbers, not as part of larger values
+    assert not provider._is_error_retryable(Exception("Prompt of 5000 characters rejected: 400 Bad Request"))
+    assert not provider._is_error_retryable(Exception("401 Unauthorized: API key invalid"))
+
+
 def test_actual_log_error_from_issue_with_structured_parsing():
     """Test the specific error from the user's log using structured parsing."""
     provider = OpenAIModelProvider(api_key="test-key")
@@ -138,3 +151,32 @@ def test_edge_cases_and_fallbacks():
 
     simple_429_error = MockSimple429Error()
     assert provider._is_error_retryable(simple_429_error), "Simple 429 without type info should be retryable"
+
+
+def test_openai_status_codes_match_on_word_boundaries():
+    """Status codes embedded in other numbers should not trigger retries."""
+    provider = OpenAIModelProvider(api_key="test-key")
+
+    assert provider._is_error_retryable(Exception("Upstream returned 503 Service Unavailable"))
+    assert provider._is_error_retryable(Exception("Read TIMEOUT while waiting for response"))
+    assert not provider._is_error_retryable(Exception("Invalid parameter: max_tokens must be <= 15000"))
+    assert not provider._is_error_retryable(Exception("Model id 4290 not found"))
+
+
+def test_openai_typed_sdk_errors_are_classified_without_string_matching():
+    """SDK exception types decide retryability before any message parsing."""
+    import httpx
+    import openai
+
+    provider = OpenAIModelProvider(api_key="test-key")
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+    def status_error(cls, status_code):
+        return cls("opaque message", response=httpx.Response(status_code, request=request), body=None)
+
+    assert provider._is_error_retryable(openai.APITimeoutError(request=request))
+    assert provider._is_error_retryable(httpx.ConnectError("opaque", request=request))
+    assert provider._is_error_retryable(status_error(openai.InternalServerError, 502))
+    assert provider._is_error_retryable(status_error(openai.APIStatusError, 408))
+    assert not provider._is_error_retryable(status_error(openai.BadRequestError, 400))
+    assert not provider._is_error_retryable(status_error(openai.AuthenticationError, 401))
@@ -0,0 +1,203 @@
+"""Tests for the exact-match provider response cache."""
+
+from unittest.mock import Mock, patch
+
+from providers.gemini import GeminiModelProvider
+from providers.shared import ModelResponse, ProviderType, ResponseCache
+
+
+def _response(content="cached text"):
+    return ModelResponse(
+        content=content,
+        usage={"input_tokens": 1, "output_tokens": 2, "total_tokens": 3},
+        model_name="gemini-2.5-flash",
+        provider=ProviderType.GOOGLE,
+        metadata={"finish_reason": "STOP"},
+    )
+
+
+class TestResponseCache:
+    def test_get_returns_flagged_copy(self):
+        cache = ResponseCache()
+        key = ResponseCache.make_key("model", None, "prompt", 0)
+        original = _response()
+        cache.put(key, original)
+
+        hit = cache.get(key)
+
+        assert hit is not original
+        assert hit.content == "cached text"
+        assert hit.metadata["cache_hit"] is True
+        assert "cache_hit" not in original.metadata
+
+        hit.metadata["cached_usage"]["input_tokens"] = 99
+        assert cache.get(key).metadata["cached_usage"]["input_tokens"] == 1
+
+    def test_hits_report_zero_usage(self):
+        cache = ResponseCache()
+        key = ResponseCache.make_key("model", None, "prompt", 0)
+        cache.put(key, _response())
+
+        hit = cache.get(key)
+
+        assert hit.usage == {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
+        assert hit.metadata["cached_usage"] == {"input_tokens": 1, "output_tokens": 2, "total_tokens": 3}
+
+    def test_key_distinguishes_all_parts(self):
+        assert ResponseCache.make_key("m", "sys", "prompt") != ResponseCache.make_key("m", "sysprompt", "")
+        assert ResponseCache.make_key("m", None, "p") != ResponseCache.make_key("m", "", "p")
+        assert ResponseCache.make_key("m", "a\x00b") != ResponseCache.make_key("m", "a", "b")
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put(b"a", _response("a"))
+        cache.put(b"b", _response("b"))
+        cache.get(b"a")
+        cache.put(b"c", _response("c"))
+
+        assert cache.get(b"b") is None
+        assert cache.get(b"a").content == "a"
+        assert cache.get(b"c").content == "c"
+
+    def test_expired_entries_are_dropped(self):
+        cache = ResponseCache(ttl_seconds=10)
+        with patch("providers.shared.response_cache.time.monotonic", return_value=100.0):
+            cache.put(b"k", _response())
+        with patch("providers.shared.response_cache.time.monotonic", return_value=111.0):
+            assert cache.get(b"k") is None
+        assert len(cache) == 0
+
+    def test_from_env_reads_size_and_ttl(self, monkeypatch):
+        monkeypatch.setenv("ZEN_RESPONSE_CACHE_SIZE", "8")
+        monkeypatch.setenv("ZEN_RESPONSE_CACHE_TTL", "30")
+
+        cache = ResponseCache.from_env()
+
+        assert cache.max_entries == 8
+        assert cache.ttl_seconds == 30.0
+
+    def test_from_env_defaults(self, monkeypatch):
+        monkeypatch.delenv("ZEN_RESPONSE_CACHE_SIZE", raising=False)
+        monkeypatch.delenv("ZEN_RESPONSE_CACHE_TTL", raising=False)
+
+        cache = ResponseCache.from_env()
+
+        assert cache.max_entries == 256
+        assert cache.ttl_seconds == 3600.0
+
+
+class TestGeminiResponseCache:
+    @patch("google.genai.Client")
+    def test_deterministic_requests_are_served_from_cache(self, mock_client_class):
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.text = "Deterministic answer"
+        mock_response.candidates = [Mock(finish_reason="STOP")]
+        mock_response.usage_metadata = Mock(prompt_token_count=5, candidates_token_count=7)
+        mock_client.models.generate_content.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        provider = GeminiModelProvider(api_key="test-key")
+
+        first = provider.generate_content(prompt="Same prompt", model_name="flash", temperature=0)
+        second = provider.generate_content(prompt="Same prompt", model_name="flash", temperature=0)
+
+        assert mock_client.models.generate_content.call_count == 1
+
+        # Any change to the generation config is a different request
+        provider.generate_content(prompt="Same prompt", model_name="flash", temperature=0, max_output_tokens=64)
+        provider.generate_content(prompt="Same prompt", model_name="flash", temperature=0, thinking_mode="high")
+
+        assert mock_client.models.generate_content.call_count == 3
+        assert "cache_hit" not in first.metadata
+        assert second.metadata["cache_hit"] is True
+        assert second.content == "Deterministic answer"
+
+    @patch("google.genai.Client")
+    def test_no_cache_bypasses_cache(self, mock_client_class):
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.text = "Fresh answer"
+        mock_response.candidates = [Mock(finish_reason="STOP")]
+        mock_response.usage_metadata = Mock(prompt_token_count=5, candidates_token_count=7)
+        mock_client.models.generate_content.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        provider = GeminiModelProvider(api_key="test-key")
+
+        provider.generate_content(prompt="Same prompt", model_name="flash", temperature=0)
+        bypassed = provider.generate_content(prompt="Same prompt", model_name="flash", temperature=0, no_cache=True)
+
+        assert mock_client.models.generate_content.call_count == 2
+        assert "cache_hit" not in bypassed.metadata
+
+    @patch("google.genai.Client")
+    def test_non_deterministic_requests_bypass_cache(self, mock_client_class):
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.text = "Creative answer"
+        mock_response.candidates = [Mock(finish_reason="STOP")]
+        mock_response.usage_metadata = Mock(prompt_token_count=5, candidates_token_count=7)
+        mock_client.models.generate_content.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        provider = GeminiModelProvider(api_key="test-key")
+
+        provider.generate_content(prompt="Same prompt", model_name="flash", temperature=0.7)
+        provider.generate_content(prompt="Same prompt", model_name="flash", temperature=0.7)
+
+        assert mock_client.models.generate_content.call_count == 2
+
+
+class TestOpenAICompatibleResponseCache:
+    @staticmethod
+    def _provider_with_mock_client():
+        from providers.openai import OpenAIModelProvider
+
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content="Deterministic answer"), finish_reason="stop")]
+        mock_response.usage = Mock(prompt_tokens=5, completion_tokens=7, total_tokens=12)
+        mock_response.model = "gpt-4.1"
+        mock_response.id = "resp-1"
+        mock_response.created = 123
+
+        provider = OpenAIModelProvider(api_key="test-key")
+        provider._client = Mock()
+        provider._client.chat.completions.create.return_value = mock_response
+        return provider
+
+    def test_deterministic_requests_are_served_from_cache(self):
+        provider = self._provider_with_mock_client()
+
+        first = provider.generate_content(prompt="Same prompt", model_name="gpt-4.1", temperature=0)
+        second = provider.generate_content(prompt="Same prompt", model_name="gpt-4.1", temperature=0)
+        provider.generate_content(prompt="Same prompt", model_name="gpt-4.1", temperature=0, seed=7)
+
+        assert provider._client.chat.completions.create.call_count == 2
+        assert "cache_hit" not in first.metadata
+        assert second.metadata["cache_hit"] is True
+        assert second.content == "Deterministic answer"
+        assert second.usage["input_tokens"] == 0
+        assert second.metadata["cached_usage"]["input_tokens"] == 5
+
+    def test_non_deterministic_requests_bypass_cache(self):
+        provider = self._provider_with_mock_client()
+
+        provider.generate_content(prompt="Same prompt", model_name="gpt-4.1", temperature=0.7)
+        provider.generate_content(prompt="Same prompt", model_name="gpt-4.1", temperature=0.7)
+
+        assert provider._client.chat.completions.create.call_count == 2
+
+    def test_no_cache_bypasses_cache(self):
+        provider = self._provider_with_mock_client()
+
+        # A bypassed call neither reads nor populates the cache
+        provider.generate_content(prompt="Same prompt", model_name="gpt-4.1", temperature=0, no_cache=True)
+        provider.generate_content(prompt="Same prompt", model_name="gpt-4.1", temperature=0)
+        assert provider._client.chat.completions.create.call_count == 2
+
+        bypassed = provider.generate_content(prompt="Same prompt", model_name="gpt-4.1", temperature=0, no_cache=True)
+
+        assert provider._client.chat.completions.create.call_count == 3
+        assert "cache_hit" not in bypassed.metadata
+        assert "no_cache" not in provider._client.chat.completions.create.call_args.kwargs
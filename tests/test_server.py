@@ -4,7 +4,8 @@ Tests for the main server functionality
 
 import pytest
 
-from server import handle_call_tool
+import server
+from server import PROMPT_CATALOG, TOOLS, handle_call_tool, handle_list_prompts, handle_list_tools
 
 
 class TestServerTools:
@@ -105,3 +106,84 @@ class TestServerTools:
         assert "## Server Information" in content
         assert "## Configuration" in content
         assert "Current Version" in content
+
+    @pytest.mark.asyncio
+    async def test_handle_list_prompts_uses_prebuilt_catalog(self):
+        """Prompt listing should serve the prebuilt catalogue without sharing the list"""
+        first = await handle_list_prompts()
+        second = await handle_list_prompts()
+
+        assert len(first) == len(TOOLS) + 1
+        assert first[-1].name == "continue"
+        assert first == list(PROMPT_CATALOG)
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_handle_list_tools_builds_catalog_once(self, monkeypatch):
+        """Tool listing should build schemas on the first request and reuse them afterwards"""
+        monkeypatch.setattr(server, "TOOL_CATALOG", None)
+        original_build = server.build_tool_catalog
+        calls = []
+
+        def counting_build(tools):
+            calls.append(tools)
+            return original_build(tools)
+
+        monkeypatch.setattr(server, "build_tool_catalog", counting_build)
+
+        first = await handle_list_tools()
+        second = await handle_list_tools()
+
+        assert len(calls) == 1
+        assert [tool.name for tool in first] == list(TOOLS)
+        assert first == second
+        assert first is not second
+
+
+class TestEventLoopFactory:
+    """Test optional uvloop selection for the stdio server"""
+
+    def test_uses_uvloop_when_installed(self, monkeypatch):
+        """The uvloop factory should be used when the package is importable"""
+        import sys
+        import types
+
+        fake_uvloop = types.SimpleNamespace(new_event_loop=object())
+        monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+        monkeypatch.setattr(sys, "platform", "linux")
+
+        assert server._get_event_loop_factory() is fake_uvloop.new_event_loop
+
+    def test_falls_back_without_uvloop(self, monkeypatch):
+        """The default asyncio loop should be used when uvloop is unavailable"""
+        import sys
+
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+
+        assert server._get_event_loop_factory() is None
+
+
+class TestLazyProviderImports:
+    """Concrete providers should only be imported when they are used"""
+
+    def test_server_import_does_not_load_gemini_sdk(self):
+        """Importing the server must not pull in google-genai before a Gemini key is configured"""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        code = (
+            "import sys, server\n"
+            "assert 'providers.gemini' not in sys.modules\n"
+            "from providers import GeminiModelProvider\n"
+            "assert GeminiModelProvider.__module__ == 'providers.gemini'\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
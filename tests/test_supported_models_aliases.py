@@ -223,3 +223,18 @@ class TestSupportedModelsAliases:
             assert provider._resolve_model_name("unknown-model") == "unknown-model"
             assert provider._resolve_model_name("gpt-4") == "gpt-4"
             assert provider._resolve_model_name("claude-3") == "claude-3"
+
+    def test_resolve_uses_registry_alias_index(self, monkeypatch):
+        """Alias resolution should use the registry index instead of scanning capabilities."""
+        from providers.shared import ModelCapabilities
+
+        provider = GeminiModelProvider("test-key")
+
+        def fail_collect(*args, **kwargs):
+            raise AssertionError("linear alias scan should not run")
+
+        monkeypatch.setattr(ModelCapabilities, "collect_aliases", staticmethod(fail_collect))
+
+        assert provider._resolve_model_name("FLASH") == "gemini-2.5-flash"
+        assert provider._resolve_model_name("Gemini-2.5-Pro") == "gemini-2.5-pro"
+        assert provider._resolve_model_name("unknown-model") == "unknown-model"
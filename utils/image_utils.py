@@ -3,7 +3,6 @@
 import base64
 import binascii
 import os
-from collections.abc import Iterable
 
 from utils.file_types import IMAGES, get_image_mime_type
 
@@ -11,10 +10,11 @@ DEFAULT_MAX_IMAGE_SIZE_MB = 20.0
 
 __all__ = ["DEFAULT_MAX_IMAGE_SIZE_MB", "validate_image"]
 
-
-def _valid_mime_types() -> Iterable[str]:
-    """Return the MIME types permitted by the IMAGES whitelist."""
-    return (get_image_mime_type(ext) for ext in IMAGES)
+# Lookup tables derived once from the IMAGES whitelist
+_EXT_TO_MIME = {ext: get_image_mime_type(ext) for ext in IMAGES}
+_VALID_MIME_TYPES = frozenset(_EXT_TO_MIME.values())
+_SUPPORTED_MIME_TYPES_TEXT = ", ".join(sorted(_VALID_MIME_TYPES))
+_SUPPORTED_FORMATS_TEXT = ", ".join(sorted(IMAGES))
 
 
 def validate_image(image_path: str, max_size_mb: float = None) -> tuple[bytes, str]:
@@ -47,13 +47,8 @@ def _validate_data_url(image_data_url: str, max_size_mb: float) -> tuple[bytes,
     except (ValueError, IndexError) as exc:
         raise ValueError(f"Invalid data URL format: {exc}")
 
-    valid_mime_types = list(_valid_mime_types())
-    if mime_type not in valid_mime_types:
-        raise ValueError(
-            "Unsupported image type: {mime}. Supported types: {supported}".format(
-                mime=mime_type, supported=", ".join(valid_mime_types)
-            )
-        )
+    if mime_type not in _VALID_MIME_TYPES:
+        raise ValueError(f"Unsupported image type: {mime_type}. Supported types: {_SUPPORTED_MIME_TYPES_TEXT}")
 
     try:
         image_bytes = base64.b64decode(data)
@@ -65,30 +60,35 @@ def _validate_data_url(image_data_url: str, max_size_mb: float) -> tuple[bytes,
 
 
 def _validate_file_path(file_path: str, max_size_mb: float) -> tuple[bytes, str]:
-    """Validate an image loaded from the filesystem."""
+    """Validate an image loaded from the filesystem.
+
+    Format and size are checked from the path and file metadata before the
+    contents are read, so rejected files are never loaded into memory.
+    """
     try:
         with open(file_path, "rb") as handle:
+            ext = os.path.splitext(file_path)[1].lower()
+            mime_type = _EXT_TO_MIME.get(ext)
+            if mime_type is None:
+                raise ValueError(f"Unsupported image format: {ext}. Supported formats: {_SUPPORTED_FORMATS_TEXT}")
+
+            _check_size(os.fstat(handle.fileno()).st_size, max_size_mb)
             image_bytes = handle.read()
     except FileNotFoundError:
         raise ValueError(f"Image file not found: {file_path}")
     except OSError as exc:
         raise ValueError(f"Failed to read image file: {exc}")
 
-    ext = os.path.splitext(file_path)[1].lower()
-    if ext not in IMAGES:
-        raise ValueError(
-            "Unsupported image format: {ext}. Supported formats: {supported}".format(
-                ext=ext, supported=", ".join(sorted(IMAGES))
-            )
-        )
-
-    mime_type = get_image_mime_type(ext)
-    _validate_size(image_bytes, max_size_mb)
     return image_bytes, mime_type
 
 
 def _validate_size(image_bytes: bytes, max_size_mb: float) -> None:
     """Ensure the image does not exceed the configured size limit."""
-    size_mb = len(image_bytes) / (1024 * 1024)
+    _check_size(len(image_bytes), max_size_mb)
+
+
+def _check_size(size_bytes: int, max_size_mb: float) -> None:
+    """Raise ``ValueError`` when ``size_bytes`` exceeds ``max_size_mb``."""
+    size_mb = size_bytes / (1024 * 1024)
     if size_mb > max_size_mb:
         raise ValueError(f"Image too large: {size_mb:.1f}MB (max: {max_size_mb}MB)")